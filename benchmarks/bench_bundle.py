@@ -0,0 +1,100 @@
+# MLB Betting Model v3.1 — Model Bundle Load Benchmark
+# ------------------------------------------------------
+# Time for a worker to get a ready-to-score model: mapping the versioned
+# `ModelBundle` file versus unpickling the fitted sklearn
+# LogisticRegression + IsotonicRegression — both in a warm process and
+# in a freshly started worker, where unpickling also has to import
+# sklearn. Also checks that the loaded bundle scores a slate exactly like
+# the in-memory one.
+#
+# Run from the repository root:
+#   python -m benchmarks.bench_bundle [--repeats 2000]
+# ------------------------------------------------------
+
+import argparse
+import os
+import pickle
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+from sklearn.isotonic import IsotonicRegression
+from sklearn.linear_model import LogisticRegression
+
+from mlb_betting.bundle import ModelBundle
+from mlb_betting.calibration import export_isotonic
+from mlb_betting.scorer import export_logistic
+
+FEATURES = ["delta_xfip", "delta_kbb", "delta_wrc", "delta_park"]
+SCALE = [0.5, 3.5, 14.0, 3.0]
+
+
+def _per_call_us(fn, repeats):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1e6
+
+
+def _cold_ms(code, runs=5):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        times.append((time.perf_counter() - start) * 1e3)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Model bundle load benchmark")
+    parser.add_argument("--repeats", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    X = rng.normal(0.0, SCALE, (20000, 4))
+    y = (rng.random(20000) < 1.0 / (1.0 + np.exp(-X @ [-0.4, 0.05, 0.02, 0.01]))).astype(int)
+    model = LogisticRegression().fit(X, y)
+    isotonic = IsotonicRegression(out_of_bounds="clip").fit(model.predict_proba(X)[:, 1], y)
+    bundle = ModelBundle(export_logistic(model, FEATURES), export_isotonic(isotonic), alpha=0.6)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bundle_path = os.path.join(tmp, "model.mlbm")
+        pickle_path = os.path.join(tmp, "model.pkl")
+        bundle.save(bundle_path)
+        with open(pickle_path, "wb") as f:
+            pickle.dump((model, isotonic), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        def unpickle():
+            with open(pickle_path, "rb") as f:
+                return pickle.load(f)
+
+        t_pickle = _per_call_us(unpickle, args.repeats)
+        t_mmap = _per_call_us(lambda: ModelBundle.load(bundle_path), args.repeats)
+        t_read = _per_call_us(lambda: ModelBundle.load(bundle_path, mmap_mode=False), args.repeats)
+
+        loaded = ModelBundle.load(bundle_path)
+        slate = rng.normal(0.0, SCALE, (15, 4))
+        odds = np.column_stack([rng.choice([-130, -110, 105, 120], 15), np.full(15, -110)])
+        expected = bundle.slate_scorer().score_slate(slate, odds)
+        got = loaded.slate_scorer().score_slate(slate, odds)
+        same = all(np.array_equal(expected[name], got[name]) for name in expected.dtype.names)
+        size = os.path.getsize(bundle_path)
+        cold_pickle = _cold_ms(f"import pickle; pickle.load(open({pickle_path!r}, 'rb'))")
+        cold_bundle = _cold_ms(f"from mlb_betting.bundle import ModelBundle; ModelBundle.load({bundle_path!r})")
+        del loaded, got
+
+    print(f"\n=== Loading a scoring model ({size:,} byte bundle, {len(bundle.calibration)} knots) ===")
+    print(f"pickle.load (sklearn objects): {t_pickle:8.1f} µs")
+    print(f"ModelBundle.load (mmap):       {t_mmap:8.1f} µs  ({t_pickle / t_mmap:.0f}× faster)")
+    print(f"ModelBundle.load (read):       {t_read:8.1f} µs")
+    print(f"fresh worker, pickle:          {cold_pickle:8.1f} ms")
+    print(f"fresh worker, bundle:          {cold_bundle:8.1f} ms  ({cold_pickle / cold_bundle:.0f}× faster)")
+    print(f"slate scores after round trip: {'identical' if same else 'MISMATCH'}")
+
+
+if __name__ == "__main__":
+    main()
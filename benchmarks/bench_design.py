@@ -0,0 +1,84 @@
+# MLB Betting Model v3.1 — Design Matrix Benchmark
+# ------------------------------------------------------
+# Time and peak extra memory to get from a chunk of raw games to the
+# model's (n, 4) float64 C-contiguous matrix:
+#   • DataFrame path: assign the four delta columns, slice df[features],
+#     .to_numpy(), np.ascontiguousarray (what the demo and the load test
+#     used to do)
+#   • DesignMatrix.build: deltas written straight into a reused buffer
+# plus, for frames that already hold the deltas, df[features].to_numpy()
+# against a build that only copies them. Both paths must give the same
+# matrix bit for bit.
+#
+# Run from the repository root:
+#   python -m benchmarks.bench_design [--games 1000000] [--repeats 10]
+# ------------------------------------------------------
+
+import argparse
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from mlb_betting.design import ENGINEERED, DesignMatrix
+from mlb_betting.synthetic import iter_games
+
+FEATURES = ["delta_xfip", "delta_kbb", "delta_wrc", "delta_park"]
+
+
+def _measure(fn, repeats):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    seconds = (time.perf_counter() - start) / repeats
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Design matrix benchmark")
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    raw = next(iter_games(args.games, chunk_size=args.games))
+    games = raw.assign(**{name: raw[a] - (raw[b] if isinstance(b, str) else b)
+                          for name, (a, b) in ENGINEERED.items()})
+    design = DesignMatrix(FEATURES)
+
+    def dataframe_path():
+        df = raw.copy(deep=False)
+        for name, (a, b) in ENGINEERED.items():
+            df[name] = df[a] - (df[b] if isinstance(b, str) else b)
+        return np.ascontiguousarray(df[FEATURES].to_numpy())
+
+    cases = [
+        ("raw games → X", dataframe_path, lambda: design.build(raw)),
+        ("delta columns → X", lambda: np.ascontiguousarray(games[FEATURES].to_numpy()),
+         lambda: design.build(games)),
+    ]
+
+    ok = True
+    matrix_mb = args.games * len(FEATURES) * 8 / 2**20
+    print(f"\n=== {args.games:,} games → ({args.games:,}, {len(FEATURES)}) float64 matrix "
+          f"({matrix_mb:.1f} MB) ===")
+    for label, old, new in cases:
+        (t_old, m_old), (t_new, m_new) = _measure(old, args.repeats), _measure(new, args.repeats)
+        same = np.array_equal(old(), new())
+        ok &= same
+        print(f"{label:<18} DataFrame {t_old * 1e3:7.1f} ms, peak +{m_old / 2**20:6.1f} MB | "
+              f"DesignMatrix {t_new * 1e3:7.1f} ms, peak +{m_new / 2**20:6.1f} MB | "
+              f"{'identical' if same else 'DIFFERENT'}")
+    X = design.build(raw)
+    ok &= X.flags.c_contiguous and X.dtype == np.float64
+    print("OK" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
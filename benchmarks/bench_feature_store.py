@@ -0,0 +1,79 @@
+# MLB Betting Model v3.1 — Feature Store Benchmark
+# ------------------------------------------------------
+# Builds a multi-season date-partitioned feature store one day at a
+# time (as the nightly job would), then times reading every column of
+# every day, a one-season backtest window of two columns, and the same
+# window from a single CSV of all features for comparison.
+#
+# Run from the repository root:
+#   python -m benchmarks.bench_feature_store [--seasons 10] [--games-per-day 15]
+# ------------------------------------------------------
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from mlb_betting.feature_store import FeatureStore
+
+FEATURES = ["delta_xfip", "delta_kbb", "delta_wrc", "delta_park"]
+SCALE = [0.57, 3.5, 14.0, 3.0]
+SEASON_DAYS = 183
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Partitioned feature store benchmark")
+    parser.add_argument("--seasons", type=int, default=10)
+    parser.add_argument("--games-per-day", type=int, default=15)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    openers = [np.datetime64(f"{2015 + s}-03-28") for s in range(args.seasons)]
+    days = np.concatenate([opener + np.arange(SEASON_DAYS) for opener in openers])
+    n = len(days) * args.games_per_day
+    frame = pd.DataFrame(rng.normal(0.0, SCALE, (n, 4)), columns=FEATURES)
+    frame.insert(0, "game_id", np.arange(n))
+    frame["date"] = np.repeat(days, args.games_per_day)
+    season = (str(openers[-1]), str(openers[-1] + SEASON_DAYS - 1))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = FeatureStore(os.path.join(tmp, "features"))
+        start = time.perf_counter()
+        for _, day in frame.groupby("date", sort=True):
+            store.append(day, FEATURES)
+        per_day = (time.perf_counter() - start) / len(days)
+
+        csv_path = os.path.join(tmp, "features.csv")
+        frame.to_csv(csv_path, index=False)
+
+        everything, t_all = _timed(lambda: store.read(FEATURES))
+        window, t_window = _timed(lambda: store.read(["delta_xfip", "delta_wrc"], *season))
+
+        def from_csv():
+            df = pd.read_csv(csv_path, parse_dates=["date"])
+            mask = (df["date"] >= season[0]) & (df["date"] <= season[1])
+            return df.loc[mask, ["game_id", "delta_xfip", "delta_wrc"]]
+
+        csv_window, t_csv = _timed(from_csv)
+        same = (np.array_equal(window["game_id"], csv_window["game_id"])
+                and np.allclose(window["delta_xfip"], csv_window["delta_xfip"], rtol=0, atol=1e-12))
+
+    print(f"\n=== Feature store: {args.seasons} seasons, {len(days):,} days, {n:,} games ===")
+    print(f"append one day:                     {per_day * 1e3:8.2f} ms")
+    print(f"read all {len(FEATURES)} columns, all days:        {t_all * 1e3:8.1f} ms  ({len(everything['game_id']):,} rows)")
+    print(f"read 2 columns, one season:         {t_window * 1e3:8.1f} ms  ({len(window['game_id']):,} rows)")
+    print(f"same window from one CSV:           {t_csv * 1e3:8.1f} ms  ({t_csv / t_window:.0f}× slower)")
+    print(f"window matches CSV:                 {'OK' if same else 'FAIL'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# MLB Betting Model v3.1 — Incremental Re-Blend Benchmark
+# ------------------------------------------------------
+# Per-tick latency of the incremental p_market → p_blended → EV → Kelly
+# update versus recomputing the whole slate as DataFrame columns.
+#
+# Run from the repository root:
+#   python -m benchmarks.bench_incremental [--games 15] [--ticks 20000]
+#       [--devig-method multiplicative|additive|power|shin]
+# ------------------------------------------------------
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from mlb_betting.best_line import BestLineIndex
+from mlb_betting.devig import METHODS, devig
+from mlb_betting.incremental import IncrementalBlender
+from mlb_betting.odds import american_to_decimal, american_to_prob
+from mlb_betting.replay import simulate_ticks
+
+
+def _full_frame(df, alpha, method):
+    implied = american_to_prob(df[["away_moneyline", "home_moneyline"]].to_numpy())
+    df["p_market"] = devig(implied, method=method)[:, 0]
+    df["p_blended"] = alpha * df["p_calibrated"] + (1 - alpha) * df["p_market"]
+    b = american_to_decimal(df["away_moneyline"].to_numpy()) - 1.0
+    df["ev"] = df["p_blended"] * b - (1 - df["p_blended"])
+    df["kelly"] = np.maximum(0.0, df["ev"] / b)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental re-blend latency benchmark")
+    parser.add_argument("--games", type=int, default=15)
+    parser.add_argument("--ticks", type=int, default=20000)
+    parser.add_argument("--budget-us", type=float, default=50.0)
+    parser.add_argument("--devig-method", choices=METHODS, default="multiplicative")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(7)
+    game_ids = np.arange(args.games)
+    p_calibrated = rng.uniform(0.4, 0.6, args.games)
+    ticks = list(simulate_ticks(game_ids, ["book_a", "book_b", "book_c"], args.ticks))
+
+    blender = IncrementalBlender(game_ids, p_calibrated, 0.7, BestLineIndex(), args.devig_method,
+                                 budget_us=args.budget_us)
+    for tick in ticks:
+        blender.on_tick(tick)
+    stats = blender.latency_summary()
+
+    df = pd.DataFrame({"p_calibrated": p_calibrated,
+                       "away_moneyline": np.full(args.games, -130.0),
+                       "home_moneyline": np.full(args.games, 110.0)})
+    n_full = min(args.ticks, 2000)
+    start = time.perf_counter()
+    for tick in ticks[:n_full]:
+        df.loc[tick.game_id, ["away_moneyline", "home_moneyline"]] = tick.prices
+        _full_frame(df, 0.7, args.devig_method)
+    full_us = (time.perf_counter() - start) / n_full * 1e6
+
+    print(f"\n=== Re-Blend Latency per Line Move ({args.games} games, {args.ticks:,} ticks, "
+          f"{args.devig_method} de-vig) ===")
+    print(f"Incremental  p50: {stats['p50_us']:.1f} µs | p99: {stats['p99_us']:.1f} µs | "
+          f"max: {stats['max_us']:.1f} µs | over {args.budget_us:.0f} µs budget: {stats['over_budget']}")
+    print(f"Full-frame   mean: {full_us:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# MLB Betting Model v3.1 — EV & Kelly Engine Benchmark
+# ------------------------------------------------------
+# Scores 10M bets with the vectorized `ev_kelly` engine and with the
+# scalar `kelly_fraction` reference in a Python loop, and checks that both
+# agree.
+#
+# Run from the repository root:
+#   python -m benchmarks.bench_kelly [--bets 10000000]
+# ------------------------------------------------------
+
+import argparse
+import time
+
+import numpy as np
+
+from mlb_betting.kelly import ev_kelly, kelly_fraction
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EV / Kelly engine benchmark")
+    parser.add_argument("--bets", type=int, default=10_000_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    p = rng.uniform(0.35, 0.65, args.bets)
+    odds = rng.choice(np.array([-250, -180, -130, -110, 100, 110, 125, 150, 210]), args.bets)
+
+    start = time.perf_counter()
+    vectorized = ev_kelly(p, odds)
+    t_vec = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scalar = [kelly_fraction(pi, oi) for pi, oi in zip(p.tolist(), odds.tolist())]
+    t_scalar = time.perf_counter() - start
+
+    kelly_ref = np.fromiter((f for f, _ in scalar), dtype=np.float64, count=args.bets)
+    max_diff = np.abs(kelly_ref - vectorized.kelly).max()
+
+    print(f"\n=== EV / Kelly on {args.bets:,} bets ===")
+    print(f"Vectorized ev_kelly:   {t_vec:8.3f} s  ({args.bets / t_vec:.3e} bets/s)")
+    print(f"Scalar kelly_fraction: {t_scalar:8.3f} s  ({args.bets / t_scalar:.3e} bets/s)")
+    print(f"Speed-up: {t_scalar / t_vec:.0f}× | max |Δ Kelly|: {max_diff:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# MLB Betting Model v3.1 — Streaming Load Test
+# ------------------------------------------------------
+# Streams 10M+ synthetic games through the full pipeline, one chunk at a
+# time, and reports throughput per stage and peak resident memory:
+#   1. generate   synthetic.iter_games (reproducible per-block seeding)
+#   2. train      OnlineLogistic.partial_fit per chunk; isotonic table
+#                 fitted on the first chunk
+#   3. score      SlateScorer.score_slate per chunk
+#   4. backtest   running bets, turnover, P&L and Brier score
+# Peak memory stays at a few chunks' worth however many games stream by.
+#
+# Run from the repository root:
+#   python -m benchmarks.bench_load [--games 10000000] [--chunk 500000]
+# ------------------------------------------------------
+
+import argparse
+import resource
+import time
+
+import numpy as np
+from sklearn.isotonic import IsotonicRegression
+
+from mlb_betting.calibration import export_isotonic
+from mlb_betting.design import DesignMatrix
+from mlb_betting.odds import american_to_decimal
+from mlb_betting.online import OnlineLogistic
+from mlb_betting.slate import SlateScorer
+from mlb_betting.synthetic import iter_games
+
+FEATURES = ["delta_xfip", "delta_kbb", "delta_wrc", "delta_park"]
+ODDS = ["away_moneyline", "home_moneyline"]
+
+
+def _peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming load test")
+    parser.add_argument("--games", type=int, default=10_000_000)
+    parser.add_argument("--chunk", type=int, default=500_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    rss_start = _peak_rss_mb()
+    timings = {"generate": 0.0, "train": 0.0, "score": 0.0}
+
+    def chunks():
+        stream = iter_games(args.games, chunk_size=args.chunk, seed=args.seed)
+        while True:
+            start = time.perf_counter()
+            df = next(stream, None)
+            timings["generate"] += time.perf_counter() - start
+            if df is None:
+                return
+            yield df
+
+    # one design-matrix buffer, refilled in place for every chunk
+    design = DesignMatrix(FEATURES)
+
+    # pass 1: stream the history into the online model
+    model = OnlineLogistic(len(FEATURES))
+    calibration = None
+    for df in chunks():
+        start = time.perf_counter()
+        X, y = design.build(df), df["actual_outcome"].to_numpy()
+        model.partial_fit(X, y)
+        if calibration is None:
+            p = model.predict_proba(X)
+            calibration = export_isotonic(IsotonicRegression(out_of_bounds="clip").fit(p, y))
+        timings["train"] += time.perf_counter() - start
+
+    # pass 2: score every game and settle the bets
+    scorer = SlateScorer(model.to_scorer(FEATURES), calibration, alpha=0.6)
+    bets = turnover = pnl = brier = 0.0
+    for df in chunks():
+        start = time.perf_counter()
+        odds = df[ODDS].to_numpy()
+        records = scorer.score_slate(design.build(df), odds)
+        y = df["actual_outcome"].to_numpy()
+        stake = records["stake"]
+        b = american_to_decimal(odds[:, 0]) - 1.0
+        profit = np.where(y == 1, stake * b, -stake)
+        bets += np.count_nonzero(stake)
+        turnover += stake.sum()
+        pnl += profit.sum()
+        brier += np.sum((records["p_blended"] - y) ** 2)
+        timings["score"] += time.perf_counter() - start
+
+    n = args.games
+    print(f"\n=== Load test: {n:,} games in {args.chunk:,}-game chunks ===")
+    for stage, seconds in (("generate (×2 passes)", timings["generate"]),
+                           ("train (online Newton)", timings["train"]),
+                           ("score + backtest", timings["score"])):
+        print(f"{stage:<24} {seconds:7.2f} s  ({n / seconds:,.0f} games/s)")
+    print(f"backtest: {bets:,.0f} bets, turnover {turnover:,.0f} bankrolls, "
+          f"ROI {pnl / turnover:+.2%}, Brier {brier / n:.4f}")
+    print(f"peak RSS: {_peak_rss_mb():,.0f} MB (at start {rss_start:,.0f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# MLB Betting Model v3.1 — Odds Conversion Benchmark
+# ------------------------------------------------------
+# Measures throughput of the vectorized odds conversions from 1e3 up to
+# 1e8 quotes, next to the old per-row `Series.apply` path for the sizes
+# where it finishes in reasonable time.
+#
+# Run from the repository root:
+#   python -m benchmarks.bench_odds [--max-exp 8] [--apply-max-exp 6]
+# ------------------------------------------------------
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from mlb_betting.odds import american_to_decimal, american_to_prob, decimal_to_fractional
+
+
+def _scalar_american_to_prob(odds):
+    return 100 / (odds + 100) if odds > 0 else (-odds) / ((-odds) + 100)
+
+
+def _best_of(fn, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Odds conversion throughput benchmark")
+    parser.add_argument("--min-exp", type=int, default=3)
+    parser.add_argument("--max-exp", type=int, default=8)
+    parser.add_argument("--apply-max-exp", type=int, default=6)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    print("\n=== Odds Conversion Throughput (quotes / second) ===")
+    print(f"{'quotes':>12} {'to_prob':>14} {'to_decimal':>14} {'to_fractional':>14} {'Series.apply':>14}")
+
+    for exp in range(args.min_exp, args.max_exp + 1):
+        n = 10 ** exp
+        lines = rng.choice(np.array([-250, -180, -130, -110, 100, 110, 125, 150, 210], dtype=np.int16), n)
+        out = np.empty(n, dtype=np.float64)
+        repeats = 5 if n <= 10 ** 6 else 1
+
+        t_prob = _best_of(lambda: american_to_prob(lines, out=out), repeats)
+        t_dec = _best_of(lambda: american_to_decimal(lines, out=out), repeats)
+        if n <= 10 ** 7:
+            t_frac = _best_of(lambda: decimal_to_fractional(out), 1)
+            frac = f"{n / t_frac:14.3e}"
+        else:
+            frac = f"{'skipped':>14}"
+        if exp <= args.apply_max_exp:
+            series = pd.Series(lines.astype(np.int64))
+            t_apply = _best_of(lambda: series.apply(_scalar_american_to_prob), 1)
+            applied = f"{n / t_apply:14.3e}"
+        else:
+            applied = f"{'skipped':>14}"
+
+        print(f"{n:>12,} {n / t_prob:14.3e} {n / t_dec:14.3e} {frac} {applied}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# MLB Betting Model v3.1 — Parallel Out-of-Fold Benchmark
+# ------------------------------------------------------
+# Wall time of the k-fold base-model + calibrator fits on multi-season
+# synthetic data, serially and in a process pool, and a check that every
+# pool size produces exactly the serial predictions.
+#
+# Run from the repository root:
+#   python -m benchmarks.bench_oof [--games 500000] [--folds 5] [--jobs 1 2 5]
+# ------------------------------------------------------
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from mlb_betting.oof import out_of_fold
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel out-of-fold benchmark")
+    parser.add_argument("--games", type=int, default=500_000, help="about 200 seasons of 2,430 games")
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 5])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    X = rng.normal(0.0, [0.5, 3.5, 14.0, 3.0], (args.games, 4))
+    y = (rng.random(args.games) < 1.0 / (1.0 + np.exp(-X @ [-0.4, 0.05, 0.02, 0.01]))).astype(int)
+
+    print(f"\n=== {args.folds}-fold OOF on {args.games:,} games ({os.cpu_count()} cores) ===")
+    reference = None
+    serial = None
+    for n_jobs in args.jobs:
+        start = time.perf_counter()
+        oof = out_of_fold(X, y, n_splits=args.folds, n_jobs=n_jobs)
+        elapsed = time.perf_counter() - start
+        if reference is None:
+            reference, serial = oof, elapsed
+        same = (np.array_equal(oof.p_base, reference.p_base)
+                and np.array_equal(oof.p_calibrated, reference.p_calibrated))
+        print(f"n_jobs={n_jobs:<3} {elapsed:7.2f} s  speed-up {serial / elapsed:4.1f}×  "
+              f"{'identical' if same else 'MISMATCH'}")
+
+
+if __name__ == "__main__":
+    main()
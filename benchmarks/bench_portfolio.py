@@ -0,0 +1,57 @@
+# MLB Betting Model v3.1 — Simultaneous Kelly Benchmark
+# ------------------------------------------------------
+# Solve time for a full MLB day (15 games × 3 markets) from a cold start
+# and warm-started after every line on the board moves slightly. With
+# three correlated bets per game the joint outcomes (4^15) are too many
+# to enumerate, so this is the simulated-scenario path; `--markets 1`
+# exercises the exact one.
+#
+# Run from the repository root:
+#   python -m benchmarks.bench_portfolio [--games 15] [--markets 3] [--rounds 50]
+# ------------------------------------------------------
+
+import argparse
+import time
+
+import numpy as np
+
+from mlb_betting.kelly import ev_kelly
+from mlb_betting.portfolio import SimultaneousKelly
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simultaneous Kelly solve-time benchmark")
+    parser.add_argument("--games", type=int, default=15)
+    parser.add_argument("--markets", type=int, default=3)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(3)
+    n = args.games * args.markets
+    groups = np.repeat(np.arange(args.games), args.markets)
+    bet_ids = [(g, m) for g in range(args.games) for m in range(args.markets)]
+    p = rng.uniform(0.40, 0.60, n)
+    odds = (1.0 + rng.uniform(-0.03, 0.05, n)) / p
+
+    cold, warm, iters = [], [], []
+    for _ in range(args.rounds):
+        solver = SimultaneousKelly()
+        start = time.perf_counter()
+        solver.solve(p, odds, groups=groups, bet_ids=bet_ids)
+        cold.append(time.perf_counter() - start)
+
+        moved = odds * (1.0 + rng.normal(0.0, 0.005, n))
+        start = time.perf_counter()
+        result = solver.solve(p, moved, groups=groups, bet_ids=bet_ids)
+        warm.append(time.perf_counter() - start)
+        iters.append(result.iterations)
+
+    independent = ev_kelly(p, odds, odds_format="decimal").kelly.sum()
+    print(f"\n=== Simultaneous Kelly: {args.games} games × {args.markets} markets ({n} bets) ===")
+    print(f"Cold start: median {np.median(cold) * 1e3:.2f} ms")
+    print(f"Warm start: median {np.median(warm) * 1e3:.2f} ms ({np.mean(iters):.1f} Newton iterations)")
+    print(f"Bankroll committed: independent Kelly {independent:.3f} | simultaneous {result.stakes.sum():.3f}")
+
+
+if __name__ == "__main__":
+    main()
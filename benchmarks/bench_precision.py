@@ -0,0 +1,106 @@
+# MLB Betting Model v3.1 — Float32 Precision Check
+# ------------------------------------------------------
+# Scores the same simulated multi-season slate through `SlateScorer` in
+# float64 and float32 and reports memory next to the tolerance checks
+# below. Every check prints OK / FAIL. The exit status is 1 if any check
+# fails, so this doubles as the float32 regression test.
+#
+# Stated tolerances (float32 vs float64):
+#   • p_base, p_market                  max |Δ| ≤ 1e-6 per game
+#   • calibrated and downstream fields  |Δ| ≤ 1e-5 for ≥ 99.9% of games,
+#                                       max |Δ| ≤ 1e-2
+#   • Brier score, log loss, mean EV    |Δ| ≤ 1e-6
+#   • bet / no-bet decisions            ≤ 0.01% of games flip (EV ≈ 0)
+#
+# The isotonic curve has near-vertical steps (slopes of 10⁴–10⁵ between
+# knots a few 1e-7 apart). A game whose p_base lands on one of them moves
+# by slope × float32 rounding, so the per-game bound after calibration
+# covers almost every game rather than every game.
+#
+# Run from the repository root:
+#   python -m benchmarks.bench_precision [--games 5000000]
+# ------------------------------------------------------
+
+import argparse
+import sys
+
+import numpy as np
+from sklearn.isotonic import IsotonicRegression
+from sklearn.linear_model import LogisticRegression
+
+from mlb_betting.calibration import export_isotonic
+from mlb_betting.scorer import export_logistic
+from mlb_betting.slate import SlateScorer
+
+FEATURES = ["delta_xfip", "delta_kbb", "delta_wrc", "delta_park"]
+SCALE = [0.57, 3.5, 14.0, 3.0]
+TOL_INPUT = 1e-6
+TOL_GAME = 1e-5
+TOL_GAME_SHARE = 1e-3
+TOL_GAME_MAX = 1e-2
+TOL_METRIC = 1e-6
+TOL_FLIPS = 1e-4
+
+
+def _metrics(p, y, ev):
+    p = p.astype(np.float64)
+    q = np.clip(p, 1e-15, 1 - 1e-15)
+    return {
+        "Brier score": np.mean((p - y) ** 2),
+        "log loss": -np.mean(y * np.log(q) + (1 - y) * np.log1p(-q)),
+        "mean EV": np.mean(ev, dtype=np.float64),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Float32 vs float64 precision check")
+    parser.add_argument("--games", type=int, default=5_000_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    X = rng.normal(0.0, SCALE, (args.games, 4))
+    y = (rng.random(args.games) < 1.0 / (1.0 + np.exp(-X @ [-0.4, 0.05, 0.02, 0.01]))).astype(np.int8)
+    away = rng.choice([-150, -130, -120, -110, 100, 110, 125, 140], args.games)
+    odds = np.column_stack([away, np.where(away > 0, -away - 20, 100)]).astype(np.int16)
+
+    train = slice(0, 50_000)
+    model = LogisticRegression().fit(X[train], y[train])
+    isotonic = IsotonicRegression(out_of_bounds="clip").fit(model.predict_proba(X[train])[:, 1], y[train])
+    scorer, calibration = export_logistic(model, FEATURES), export_isotonic(isotonic)
+
+    results, memory = {}, {}
+    for dtype in (np.float64, np.float32):
+        features = X.astype(dtype)
+        records = SlateScorer(scorer, calibration, alpha=0.6, dtype=dtype).score_slate(features, odds)
+        results[dtype] = records
+        memory[dtype] = features.nbytes + records.nbytes
+
+    r64, r32 = results[np.float64], results[np.float32]
+    failed = False
+
+    def check(label, value, tol):
+        nonlocal failed
+        ok = value <= tol
+        failed |= not ok
+        print(f"{label:<34} {value:10.2e}  {'OK' if ok else 'FAIL'} at {tol:.0e}")
+
+    print(f"\n=== float32 vs float64 on {args.games:,} games ===")
+    print(f"{'memory (features + records)':<34} {memory[np.float64] / 2**20:8.0f} MB → "
+          f"{memory[np.float32] / 2**20:.0f} MB ({memory[np.float32] / memory[np.float64]:.0%})")
+    for name in r64.dtype.names:
+        diff = np.abs(r64[name] - r32[name].astype(np.float64))
+        if name in ("p_base", "p_market"):
+            check(f"max |Δ {name}|", diff.max(), TOL_INPUT)
+        else:
+            check(f"share |Δ {name}| > {TOL_GAME:.0e}", np.mean(diff > TOL_GAME), TOL_GAME_SHARE)
+            check(f"max |Δ {name}|", diff.max(), TOL_GAME_MAX)
+    m64, m32 = _metrics(r64["p_blended"], y, r64["ev"]), _metrics(r32["p_blended"], y, r32["ev"])
+    for name in m64:
+        check(f"|Δ {name}|", abs(m64[name] - m32[name]), TOL_METRIC)
+    flips = np.mean((r64["stake"] > 0) != (r32["stake"] > 0))
+    check("bet decisions flipped", flips, TOL_FLIPS)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
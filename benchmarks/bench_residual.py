@@ -0,0 +1,83 @@
+# MLB Betting Model v3.1 — Residual Learner Benchmark
+# ------------------------------------------------------
+# Training time and peak memory of the histogram residual learner
+# (HistGradientBoostingRegressor on y − p_blended, early stopping, all
+# cores) against sklearn's exact GradientBoostingClassifier, as the
+# number of games grows. Every fit runs in a fresh process so peak RSS
+# (ru_maxrss) belongs to that fit alone.
+#
+# Run from the repository root:
+#   python -m benchmarks.bench_residual [--sizes 10000 100000 1000000 3000000]
+#                                       [--gbc-max 1000000]
+# ------------------------------------------------------
+
+import argparse
+import multiprocessing
+import os
+import resource
+import time
+
+import numpy as np
+
+FEATURES = 4
+
+
+def _games(n, seed=42):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(0.0, [0.5, 3.5, 14.0, 3.0], (n, FEATURES))
+    z = X @ [-0.4, 0.05, 0.02, 0.01]
+    p_market = 1.0 / (1.0 + np.exp(-0.8 * z))
+    # a matchup effect the blend misses: strong lineups in pitcher parks
+    z_true = z + 0.3 * (X[:, 2] > 10) * (X[:, 3] < 0)
+    y = (rng.random(n) < 1.0 / (1.0 + np.exp(-z_true))).astype(int)
+    return X, y, p_market
+
+
+def _fit(kind, n, queue):
+    from sklearn.ensemble import GradientBoostingClassifier
+
+    from mlb_betting.residual import ResidualLearner
+
+    X, y, p_blended = _games(n)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if kind == "hist":
+        trees = ResidualLearner().fit(X, y, p_blended).n_trees
+    else:
+        model = GradientBoostingClassifier(n_estimators=100, max_depth=3, random_state=42)
+        trees = model.fit(np.column_stack([X, p_blended]), y).n_estimators_
+    elapsed = time.perf_counter() - start
+    rss_peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((elapsed, (rss_peak - rss_before) / 1024, trees))
+
+
+def _run(kind, n):
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_fit, args=(kind, n, queue))
+    proc.start()
+    result = queue.get()
+    proc.join()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Residual learner training benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000, 3_000_000])
+    parser.add_argument("--gbc-max", type=int, default=1_000_000,
+                        help="skip GradientBoostingClassifier above this many games")
+    args = parser.parse_args()
+
+    print(f"\n=== Residual learner training ({os.cpu_count()} cores) ===")
+    print(f"{'games':>10} {'model':<28} {'trees':>6} {'time':>9} {'peak Δ RSS':>11}")
+    for n in args.sizes:
+        runs = [("hist", "HistGradientBoosting (ours)")]
+        if n <= args.gbc_max:
+            runs.append(("gbc", "GradientBoostingClassifier"))
+        for kind, label in runs:
+            elapsed, mem_mb, trees = _run(kind, n)
+            print(f"{n:>10,} {label:<28} {trees:>6} {elapsed:>8.2f}s {mem_mb:>9.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
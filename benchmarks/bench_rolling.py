@@ -0,0 +1,105 @@
+# MLB Betting Model v3.1 — Rolling Stat Engine Benchmark
+# ------------------------------------------------------
+# Synthetic multi-season starting-pitcher logs (30 teams, 5-man
+# rotations, 162 games). Measures:
+#   • `rolling_sum` recomputing every "last 5 starts" and "last 14 days"
+#     window in one pass, against pandas groupby-shift-rolling
+#   • `RollingState` replaying the same starts one at a time (O(1) per
+#     update), checked against the batch result
+#
+# Run from the repository root:
+#   python -m benchmarks.bench_rolling [--seasons 5]
+# ------------------------------------------------------
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from mlb_betting.rolling import PITCHER_COMPONENTS, RollingState, k_bb_pct, rolling_sum, xfip
+
+TEAMS = 30
+ROTATION = 5
+GAMES = 162
+
+
+def _starts(seasons, seed=42):
+    rng = np.random.default_rng(seed)
+    rows = seasons * TEAMS * GAMES
+    game = np.arange(rows) // TEAMS
+    team = np.arange(rows) % TEAMS
+    season = game // GAMES
+    # each team's rotation cycles; pitchers are new every season
+    pitcher = (season * TEAMS + team) * ROTATION + (game % GAMES) % ROTATION
+    # ~1 game per day, with an off day every 6th
+    day = np.datetime64("2015-03-28") + season * 365 + (game % GAMES) * 7 // 6
+    bf = rng.poisson(24, rows).astype(float)
+    k = rng.binomial(bf.astype(int), 0.23).astype(float)
+    bb = rng.binomial(bf.astype(int), 0.08).astype(float)
+    hbp = rng.binomial(bf.astype(int), 0.01).astype(float)
+    fb = rng.binomial((bf - k - bb).astype(int), 0.36).astype(float)
+    ip = np.round((bf - bb - hbp) * 0.30, 1)
+    return pd.DataFrame({"pitcher": pitcher, "date": day, "ip": ip, "bf": bf, "k": k,
+                         "bb": bb, "hbp": hbp, "fb": fb})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rolling stat engine benchmark")
+    parser.add_argument("--seasons", type=int, default=5)
+    parser.add_argument("--starts", type=int, default=5, help="game window")
+    parser.add_argument("--days", type=int, default=14, help="day window")
+    args = parser.parse_args()
+
+    logs = _starts(args.seasons)
+    cols = list(PITCHER_COMPONENTS)
+    values = logs[cols].to_numpy()
+
+    start = time.perf_counter()
+    sums, counts = rolling_sum(values, logs["pitcher"], args.starts)
+    day_sums, day_counts = rolling_sum(values, logs["pitcher"], args.days, times=logs["date"])
+    features = {"xfip": xfip(sums), "k_bb_pct": k_bb_pct(sums)}
+    t_engine = time.perf_counter() - start
+
+    start = time.perf_counter()
+    shifted = logs.groupby("pitcher")[cols].shift(1)
+    shifted["pitcher"] = logs["pitcher"]
+    naive = (shifted.groupby("pitcher")[cols].rolling(args.starts, min_periods=1).sum()
+             .reset_index(level=0, drop=True).sort_index())
+    by_day = (logs.set_index("date").groupby("pitcher")[cols]
+              .rolling(f"{args.days}D", closed="left").sum())
+    t_pandas = time.perf_counter() - start
+
+    has_games = counts > 0
+    diff_games = np.abs(sums[has_games] - naive.to_numpy()[has_games]).max()
+    # pandas returns the day windows grouped by pitcher, in date order
+    order = np.lexsort((logs["date"].to_numpy(), logs["pitcher"].to_numpy()))
+    expected_days = np.nan_to_num(by_day.to_numpy())
+    diff_days = np.abs(day_sums[order] - expected_days).max()
+
+    state = RollingState(len(cols), args.starts)
+    day_state = RollingState(len(cols), args.days, by="days")
+    live = np.empty_like(sums)
+    live_days = np.empty_like(day_sums)
+    pitchers, dates = logs["pitcher"].to_numpy(), logs["date"].to_numpy()
+    start = time.perf_counter()
+    for i in range(len(logs)):
+        live[i] = state.sums(pitchers[i])[0]
+        live_days[i] = day_state.sums(pitchers[i], dates[i])[0]
+        state.update(pitchers[i], values[i])
+        day_state.update(pitchers[i], values[i], dates[i])
+    t_live = (time.perf_counter() - start) / len(logs)
+    diff_live = max(np.abs(live - sums).max(), np.abs(live_days - day_sums).max())
+
+    print(f"\n=== Rolling windows over {len(logs):,} starts by {logs['pitcher'].nunique():,} pitchers ===")
+    print(f"rolling_sum ({args.starts} starts + {args.days} days, xFIP, K-BB%): {t_engine * 1e3:8.1f} ms")
+    print(f"pandas groupby-shift-rolling:                {t_pandas * 1e3:8.1f} ms  ({t_pandas / t_engine:.0f}× slower)")
+    print(f"RollingState per start (2 windows):          {t_live * 1e6:8.1f} µs")
+    print(f"max |Δ| vs pandas: {max(diff_games, diff_days):.2e} | live vs batch: {diff_live:.2e} "
+          f"({'OK' if max(diff_games, diff_days, diff_live) <= 1e-9 else 'FAIL'} at 1e-9)")
+    print(f"median rolling xFIP {np.nanmedian(features['xfip']):.2f}, "
+          f"K-BB% {np.nanmedian(features['k_bb_pct']):.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# MLB Betting Model v3.1 — Compact Schema Benchmark
+# ------------------------------------------------------
+# Memory of a streamed games chunk and of a recommendations frame under
+# the compact schemas (categoricals, int16 odds, int8 outcomes, float32
+# stats) against plain object / int64 / float64 dtypes, plus checks that
+# nothing is lost:
+#   • integer columns round-trip exactly
+#   • float32 columns stay within float32 rounding of the float64 values
+#   • a cast that would wrap (odds beyond int16) is refused
+#
+# Run from the repository root:
+#   python -m benchmarks.bench_schema [--games 1000000]
+# ------------------------------------------------------
+
+import argparse
+import sys
+
+import numpy as np
+import pandas as pd
+
+from mlb_betting.schema import (BET_TYPES, RECOMMENDATIONS, RESULTS_SCHEMA, RISK_LEVELS,
+                                apply_schema, memory_report, widen)
+from mlb_betting.synthetic import iter_games
+
+
+def _recommendations(n, seed):
+    rng = np.random.default_rng(seed)
+    teams = ["Dodgers", "Phillies", "Yankees", "Astros", "Braves", "Mets", "Padres", "Cubs"]
+    away, home = rng.choice(teams, n), rng.choice(teams, n)
+    return pd.DataFrame({
+        "Game": [f"{a} @ {h}" for a, h in zip(away, home)],
+        "Bet_Type": rng.choice(BET_TYPES, n),
+        "Probability_%": np.round(rng.uniform(52, 68, n), 2),
+        "Odds": rng.choice([-145, -130, -120, -110, 100, 105, 120], n),
+        "EV_per_$": np.round(rng.uniform(0.02, 0.08, n), 3),
+        "Risk_Level": rng.choice(RISK_LEVELS, n),
+        "Recommendation": rng.choice(RECOMMENDATIONS, n),
+        "Actual_Result": rng.integers(0, 2, n),
+        "Came_True": rng.choice(["Yes", "No"], n),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compact schema memory benchmark")
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    games64 = next(iter_games(args.games, chunk_size=args.games, seed=args.seed))
+    games32 = next(iter_games(args.games, chunk_size=args.games, seed=args.seed, dtype=np.float32))
+    recs = _recommendations(args.games, args.seed)
+    compact = apply_schema(recs.copy(), RESULTS_SCHEMA)
+
+    print(f"\n=== Frame memory, {args.games:,} rows ===")
+    print(memory_report({"games (float64)": games64, "games (float32)": games32,
+                         "recommendations": compact}).to_string(index=False, float_format="%.0f"))
+
+    ok = True
+    for name in games32.columns:
+        a, b = games64[name].to_numpy(), games32[name].to_numpy()
+        if b.dtype.kind in "iu":
+            same = np.array_equal(a, b)
+        elif b.dtype.kind == "f":
+            same = np.allclose(b, a, rtol=np.finfo(np.float32).eps, atol=0)
+        else:
+            same = np.array_equal(a, b)
+        if not same:
+            print(f"FAIL: games column {name} changed")
+            ok = False
+    if not widen(compact, {"Probability_%": 2, "EV_per_$": 3}).equals(recs):
+        print("FAIL: recommendations do not round-trip")
+        ok = False
+    try:
+        apply_schema(pd.DataFrame({"Odds": [-110, 40000]}), RESULTS_SCHEMA)
+        print("FAIL: odds beyond int16 were cast")
+        ok = False
+    except ValueError:
+        pass
+    print("OK" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+# MLB Betting Model v3.1 — NumPy Scorer Benchmark
+# ------------------------------------------------------
+# Per-slate latency of sklearn's `predict_proba` on a DataFrame versus
+# the exported `LogisticScorer` on a float64 array, and the maximum
+# absolute difference between the two.
+#
+# Run from the repository root:
+#   python -m benchmarks.bench_scorer [--games 15] [--repeats 2000]
+# ------------------------------------------------------
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+
+from mlb_betting.scorer import LogisticScorer, export_logistic
+
+FEATURES = ["delta_xfip", "delta_kbb", "delta_wrc", "delta_park"]
+
+
+def _per_call_us(fn, repeats):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Logistic scorer latency benchmark")
+    parser.add_argument("--games", type=int, default=15)
+    parser.add_argument("--repeats", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    train = pd.DataFrame(rng.normal(0.0, [0.5, 3.5, 14.0, 3.0], (5000, 4)), columns=FEATURES)
+    y = (rng.random(5000) < 1.0 / (1.0 + np.exp(-train.to_numpy() @ [-0.4, 0.05, 0.02, 0.01]))).astype(int)
+    model = LogisticRegression().fit(train, y)
+
+    # round-trip through the on-disk format, as a worker would load it
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "base_model.npz")
+        export_logistic(model, FEATURES).save(path)
+        scorer = LogisticScorer.load(path)
+
+    slate = pd.DataFrame(rng.normal(0.0, [0.5, 3.5, 14.0, 3.0], (args.games, 4)), columns=FEATURES)
+    X = np.ascontiguousarray(slate.to_numpy())
+    out = np.empty(args.games)
+
+    t_sklearn = _per_call_us(lambda: model.predict_proba(slate), args.repeats)
+    t_numpy = _per_call_us(lambda: scorer.predict_proba(X, out=out), args.repeats)
+
+    big = pd.DataFrame(rng.normal(0.0, [0.5, 3.5, 14.0, 3.0], (1_000_000, 4)), columns=FEATURES)
+    max_diff = np.abs(model.predict_proba(big)[:, 1] - scorer.predict_proba(big.to_numpy())).max()
+
+    print(f"\n=== Scoring a {args.games}-game slate ===")
+    print(f"sklearn predict_proba: {t_sklearn:8.1f} µs")
+    print(f"LogisticScorer:        {t_numpy:8.1f} µs  ({t_sklearn / t_numpy:.0f}× faster)")
+    print(f"max |Δp| over 1M rows: {max_diff:.2e} ({'OK' if max_diff <= 1e-12 else 'FAIL'} at 1e-12)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# MLB Betting Model v3.1 — Cold-Start Benchmark
+# ------------------------------------------------------
+# Wall-clock time of fresh interpreter runs for the scoring-only paths,
+# against a bare interpreter and an eager pandas + sklearn import.
+# Target: scoring-only commands well under 200 ms.
+#
+# Run from the repository root:
+#   python -m benchmarks.bench_startup [--runs 7]
+# ------------------------------------------------------
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from mlb_betting.scorer import LogisticScorer
+
+TARGET_MS = 200.0
+
+
+def _median_ms(cmd, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL)
+        times.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-start benchmark")
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        model = os.path.join(tmp, "base_model.npz")
+        slate = os.path.join(tmp, "slate.csv")
+        features = ["delta_xfip", "delta_kbb", "delta_wrc", "delta_park"]
+        LogisticScorer([-0.4, 0.05, 0.02, 0.01], [0.1], features).save(model)
+        np.savetxt(slate, np.random.default_rng(0).normal(size=(15, 4)), delimiter=",",
+                   header=",".join(features), comments="")
+
+        py = sys.executable
+        cases = [
+            ("python (bare interpreter)", [py, "-c", "pass"], False),
+            ("import pandas + sklearn", [py, "-c", "import pandas, sklearn.linear_model"], False),
+            ("from mlb_betting import american_to_prob",
+             [py, "-c", "from mlb_betting import american_to_prob"], True),
+            ("mlb-betting odds -130 110", [py, "-m", "mlb_betting", "odds", "-130", "110"], True),
+            ("mlb-betting score (15 games)", [py, "-m", "mlb_betting", "score", model, slate], True),
+        ]
+
+        print(f"\n=== Cold start, median of {args.runs} runs ===")
+        for label, cmd, scoring in cases:
+            ms = _median_ms(cmd, args.runs)
+            verdict = ("OK" if ms < TARGET_MS else "OVER") if scoring else ""
+            print(f"{label:<44} {ms:8.1f} ms  {verdict}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# MLB Betting Model v3.1
+# ------------------------------------------------------
+# Public names are resolved lazily: `from mlb_betting import american_to_prob`
+# imports only the odds module (NumPy), never pandas, sklearn or the demo.
+# ------------------------------------------------------
+
+import importlib
+
+__version__ = "3.1.0"
+
+_LAZY = {
+    "american_to_prob": "odds",
+    "american_to_decimal": "odds",
+    "prob_to_american": "odds",
+    "decimal_to_american": "odds",
+    "decimal_to_prob": "odds",
+    "prob_to_decimal": "odds",
+    "decimal_to_fractional": "odds",
+    "fractional_to_decimal": "odds",
+    "devig": "devig",
+    "devig_american": "devig",
+    "Tick": "tick_store",
+    "TickStore": "tick_store",
+    "ReplayFeed": "replay",
+    "BestLineIndex": "best_line",
+    "IncrementalBlender": "incremental",
+    "FeatureStore": "feature_store",
+    "DesignMatrix": "design",
+    "design_matrix": "design",
+    "iter_games": "synthetic",
+    "rolling_sum": "rolling",
+    "RollingState": "rolling",
+    "apply_schema": "schema",
+    "memory_report": "schema",
+    "ev_kelly": "kelly",
+    "kelly_fraction": "kelly",
+    "SimultaneousKelly": "portfolio",
+    "blend_linear": "blending",
+    "BlendCV": "blending",
+    "SegmentedAlpha": "blending",
+    "LogitBlend": "blending",
+    "OnlineLogistic": "online",
+    "drift_check": "online",
+    "out_of_fold": "oof",
+    "ResidualLearner": "residual",
+    "LogisticScorer": "scorer",
+    "SlateScorer": "slate",
+    "slate_dtype": "slate",
+    "export_logistic": "scorer",
+    "IsotonicTable": "calibration",
+    "export_isotonic": "calibration",
+    "ModelBundle": "bundle",
+    "ModelCache": "cache",
+    "artifact_key": "cache",
+}
+
+__all__ = sorted(_LAZY)
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,119 @@
+# MLB Betting Model v3.1 — Best-Line Index
+# ------------------------------------------------------
+# Keeps the top-of-book price (best payout for the bettor) per
+# (game, market, side) across every sportsbook, so EV and Kelly read the
+# best available odds with one dict lookup instead of rescanning books.
+#
+# Updates are incremental:
+#   • a quote that beats the current best replaces it in O(1)
+#   • a quote from a non-best book only updates that book's entry
+#   • only when the best book worsens or goes away are that key's
+#     remaining books rescanned (O(books quoting that key), ~10)
+# Stale quotes are expired through a timestamp heap, so `expire` touches
+# only the quotes that actually aged out. Every quote pushes an entry and
+# a re-quote or pull leaves the old one behind, so once the heap holds
+# COMPACT_RATIO × the live quotes it is rebuilt from them, whether or not
+# `expire` is ever called (amortised O(1) per update).
+# ------------------------------------------------------
+
+import heapq
+from collections import namedtuple
+
+import numpy as np
+
+Quote = namedtuple("Quote", ["book", "american", "decimal", "ts"])
+COMPACT_RATIO = 4
+COMPACT_MIN = 1024
+
+
+def _decimal(american):
+    return 1.0 + (american / 100.0 if american > 0 else 100.0 / -american)
+
+
+class BestLineIndex:
+    def __init__(self):
+        self._quotes = {}   # (game, market, side) -> {book: Quote}
+        self._best = {}     # (game, market, side) -> Quote
+        self._expiry = []   # heap of (ts, key, book)
+        self._live = 0      # quotes held, across all keys and books
+
+    def __len__(self):
+        return len(self._best)
+
+    def _rescan(self, key):
+        books = self._quotes.get(key)
+        if books:
+            self._best[key] = max(books.values(), key=lambda q: q.decimal)
+        else:
+            self._quotes.pop(key, None)
+            self._best.pop(key, None)
+
+    def _compact(self):
+        # drop the entries of re-quoted and pulled quotes: one per live quote
+        self._expiry = [(q.ts, key, book) for key, books in self._quotes.items() for book, q in books.items()]
+        heapq.heapify(self._expiry)
+
+    # -------------------------------------------------
+    # Writes
+    # -------------------------------------------------
+
+    def update(self, game_id, market, side, book, american, ts):
+        """Record `book`'s current American price for one side of a market."""
+        key = (game_id, market, side)
+        quote = Quote(book, float(american), _decimal(american), float(ts))
+        books = self._quotes.setdefault(key, {})
+        self._live += book not in books
+        books[book] = quote
+        heapq.heappush(self._expiry, (quote.ts, key, book))
+        if len(self._expiry) > max(COMPACT_RATIO * self._live, COMPACT_MIN):
+            self._compact()
+
+        best = self._best.get(key)
+        if best is None or quote.decimal >= best.decimal:
+            self._best[key] = quote
+        elif best.book == book:
+            self._rescan(key)
+
+    def update_tick(self, tick, sides=("away", "home")):
+        """Apply a `tick_store.Tick` carrying one price per side."""
+        for side, price in zip(sides, tick.prices):
+            if price == price:  # skip NaN sides
+                self.update(tick.game_id, tick.market, side, tick.book, price, tick.ts)
+
+    def remove(self, game_id, market, side, book):
+        """Pull a quote (book suspended the market)."""
+        key = (game_id, market, side)
+        books = self._quotes.get(key)
+        if books is None or books.pop(book, None) is None:
+            return
+        self._live -= 1
+        best = self._best.get(key)
+        if best is not None and best.book == book:
+            self._rescan(key)
+
+    def expire(self, now, max_age):
+        """Drop every quote older than `max_age`; returns how many were dropped."""
+        cutoff = now - max_age
+        dropped = 0
+        while self._expiry and self._expiry[0][0] < cutoff:
+            ts, key, book = heapq.heappop(self._expiry)
+            quote = self._quotes.get(key, {}).get(book)
+            # the heap entry is stale if the book has re-quoted since
+            if quote is not None and quote.ts == ts:
+                self.remove(*key, book)
+                dropped += 1
+        return dropped
+
+    # -------------------------------------------------
+    # Reads
+    # -------------------------------------------------
+
+    def best(self, game_id, market, side):
+        """Best `Quote` for one side of a market, or None if nobody quotes it."""
+        return self._best.get((game_id, market, side))
+
+    def best_american(self, keys):
+        """Best American price for many (game, market, side) keys; NaN where unquoted."""
+        nan = Quote(None, np.nan, np.nan, np.nan)
+        return np.fromiter((self._best.get(k, nan).american for k in keys),
+                           dtype=np.float64, count=len(keys))
@@ -0,0 +1,251 @@
+# MLB Betting Model v3.1 — Market Blending
+# ------------------------------------------------------
+#   P_post = α × P_model + (1 − α) × P_market
+#
+# α is learned by cross-validation on out-of-fold model probabilities.
+# `BlendCV` keeps the OOF probabilities, market probabilities and fold
+# membership in memory and evaluates any set of candidate α values as one
+# vector operation — an (n_alphas × n_games) blend reduced to per-fold
+# losses with a single matrix product — so a grid or golden-section search
+# costs a handful of passes over the data, with all folds scored together.
+# ------------------------------------------------------
+
+from collections import namedtuple
+
+import numpy as np
+
+EPS = 1e-6
+INV_PHI = (np.sqrt(5.0) - 1.0) / 2.0
+
+AlphaFit = namedtuple("AlphaFit", ["alpha", "loss", "fold_alphas", "method"])
+
+
+def blend_linear(p_model, p_market, alpha):
+    return alpha * np.asarray(p_model) + (1.0 - alpha) * np.asarray(p_market)
+
+
+def _pointwise_loss(p, y, metric):
+    if metric == "log_loss":
+        p = np.clip(p, EPS, 1.0 - EPS)
+        return -(y * np.log(p) + (1.0 - y) * np.log1p(-p))
+    if metric == "brier":
+        return (p - y) ** 2
+    raise ValueError(f"unknown metric {metric!r}; expected 'log_loss' or 'brier'")
+
+
+class BlendCV:
+    def __init__(self, p_model, p_market, y, folds, metric="log_loss"):
+        self.p_model = np.asarray(p_model, dtype=np.float64)
+        self.p_market = np.asarray(p_market, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        self.folds = np.asarray(folds)
+        self.metric = metric
+        self.n_folds = int(self.folds.max()) + 1
+        self.fold_sizes = np.bincount(self.folds, minlength=self.n_folds)
+        # per-fold mean as one matrix product: (n_alphas × n) @ (n × n_folds)
+        self._fold_mean = np.zeros((len(self.y), self.n_folds))
+        self._fold_mean[np.arange(len(self.y)), self.folds] = 1.0 / self.fold_sizes[self.folds]
+        self._spread = self.p_model - self.p_market
+
+    def losses(self, alphas):
+        """(n_folds, n_alphas) mean loss of every candidate α on every fold."""
+        alphas = np.atleast_1d(np.asarray(alphas, dtype=np.float64))
+        blended = self.p_market + alphas[:, None] * self._spread
+        return (_pointwise_loss(blended, self.y, self.metric) @ self._fold_mean).T
+
+    def _per_fold_losses(self, fold_alphas):
+        # each fold scored at its own α in one pass
+        blended = self.p_market + fold_alphas[self.folds] * self._spread
+        loss = _pointwise_loss(blended, self.y, self.metric)
+        return np.bincount(self.folds, weights=loss, minlength=self.n_folds) / self.fold_sizes
+
+    def _pooled(self, fold_losses):
+        return fold_losses @ self.fold_sizes / self.fold_sizes.sum()
+
+    def grid(self, candidates=None):
+        candidates = np.linspace(0.0, 1.0, 101) if candidates is None else np.asarray(candidates)
+        fold_losses = self.losses(candidates)
+        pooled = self._pooled(fold_losses.T)
+        best = int(np.argmin(pooled))
+        return AlphaFit(float(candidates[best]), float(pooled[best]),
+                        candidates[np.argmin(fold_losses, axis=1)], "grid")
+
+    def golden(self, lo=0.0, hi=1.0, tol=1e-4):
+        # golden-section search run in lockstep for every fold (its own α)
+        # and for the pooled objective (one α shared by all folds)
+        k = self.n_folds
+        a, b = np.full(k + 1, lo), np.full(k + 1, hi)
+        c, d = b - INV_PHI * (b - a), a + INV_PHI * (b - a)
+
+        def evaluate(x):
+            per_fold = self._per_fold_losses(x[:k])
+            pooled = self._pooled(self._per_fold_losses(np.full(k, x[k])))
+            return np.append(per_fold, pooled)
+
+        fc, fd = evaluate(c), evaluate(d)
+        while np.max(b - a) > tol:
+            left = fc < fd
+            b = np.where(left, d, b)
+            a = np.where(left, a, c)
+            c_new = b - INV_PHI * (b - a)
+            d_new = a + INV_PHI * (b - a)
+            # reuse the surviving interior point, evaluate the new one
+            reuse_c = np.where(left, c, d)
+            reuse_f = np.where(left, fc, fd)
+            probe = np.where(left, c_new, d_new)
+            f_probe = evaluate(probe)
+            c = np.where(left, c_new, reuse_c)
+            d = np.where(left, reuse_c, d_new)
+            fc, fd = np.where(left, f_probe, reuse_f), np.where(left, reuse_f, f_probe)
+
+        best = (a + b) / 2.0
+        loss = self._pooled(self._per_fold_losses(np.full(k, best[k])))
+        return AlphaFit(float(best[k]), float(loss), best[:k], "golden")
+
+    def fit(self, method="golden", **kwargs):
+        if method == "golden":
+            return self.golden(**kwargs)
+        if method == "grid":
+            return self.grid(**kwargs)
+        raise ValueError(f"unknown search method {method!r}; expected 'golden' or 'grid'")
+
+
+# =====================================================
+# Segmented α (odds bucket × month × market type)
+# =====================================================
+
+ODDS_EDGES = (0.35, 0.42, 0.48, 0.52, 0.58, 0.65)
+MONTH_EDGES = (5, 6, 7, 8, 9)          # ≤ April | May | … | August | September +
+MARKET_TYPES = ("moneyline", "run_line", "total")
+
+
+class SegmentedAlpha:
+    """
+    Blend weight per (odds bucket, month, market type), stored as a small
+    float32 table and applied to a whole slate with `np.searchsorted`.
+
+    Odds buckets are on the market's implied probability of the side, so
+    heavy favourites, near pick'ems and long shots each get their own α.
+    """
+
+    def __init__(self, table, odds_edges=ODDS_EDGES, month_edges=MONTH_EDGES,
+                 market_types=MARKET_TYPES):
+        self.odds_edges = np.asarray(odds_edges, dtype=np.float64)
+        self.month_edges = np.asarray(month_edges, dtype=np.int64)
+        self.market_types = tuple(market_types)
+        self.table = np.ascontiguousarray(table, dtype=np.float32)
+        expected = (len(self.odds_edges) + 1, len(self.month_edges) + 1, len(self.market_types))
+        if self.table.shape != expected:
+            raise ValueError(f"alpha table shape {self.table.shape} does not match segments {expected}")
+
+    def market_codes(self, market_type):
+        """Integer codes for market-type labels (a single label or an array)."""
+        lookup = {name: i for i, name in enumerate(self.market_types)}
+        if isinstance(market_type, str):
+            return lookup[market_type]
+        return np.fromiter((lookup[m] for m in market_type), dtype=np.int64, count=len(market_type))
+
+    def segment(self, p_market, month, market_code=0):
+        n_month, n_market = self.table.shape[1], self.table.shape[2]
+        i = np.searchsorted(self.odds_edges, p_market, side="right")
+        j = np.searchsorted(self.month_edges, month, side="right")
+        return (i * n_month + j) * n_market + market_code
+
+    def __call__(self, p_market, month, market_code=0):
+        """α for every row — one table gather, no per-row Python."""
+        return self.table.ravel()[self.segment(p_market, month, market_code)]
+
+    @classmethod
+    def fit(cls, p_model, p_market, y, month, market_code=0, candidates=None, prior_strength=100,
+            metric="log_loss", odds_edges=ODDS_EDGES, month_edges=MONTH_EDGES,
+            market_types=MARKET_TYPES):
+        """
+        Learn α per segment from (ideally out-of-fold) model probabilities.
+
+        All candidates are scored for all segments in one pass: the loss
+        matrix is sorted by segment and reduced with `np.add.reduceat`.
+        Each segment's best α is shrunk towards the global best α with
+        weight n / (n + prior_strength), so thin segments stay near it.
+        """
+        candidates = np.linspace(0.0, 1.0, 101) if candidates is None else np.asarray(candidates)
+        p_model = np.asarray(p_model, dtype=np.float64)
+        p_market = np.asarray(p_market, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+
+        shape = (len(odds_edges) + 1, len(month_edges) + 1, len(market_types))
+        model = cls(np.zeros(shape), odds_edges, month_edges, market_types)
+        seg = np.broadcast_to(model.segment(p_market, month, market_code), y.shape)
+        order = np.argsort(seg, kind="stable")
+        seg_sorted = seg[order]
+        starts = np.flatnonzero(np.r_[True, seg_sorted[1:] != seg_sorted[:-1]])
+        present = seg_sorted[starts]
+        counts = np.diff(np.r_[starts, len(seg_sorted)])
+
+        blended = p_market[order] + candidates[:, None] * (p_model - p_market)[order]
+        loss = _pointwise_loss(blended, y[order], metric)
+        seg_loss = np.add.reduceat(loss, starts, axis=1)
+
+        global_alpha = candidates[np.argmin(seg_loss.sum(axis=1))]
+        best = candidates[np.argmin(seg_loss, axis=0)]
+        weight = counts / (counts + prior_strength)
+
+        table = np.full(model.table.size, global_alpha, dtype=np.float32)
+        table[present] = weight * best + (1.0 - weight) * global_alpha
+        model.table = table.reshape(model.table.shape)
+        return model
+
+
+# =====================================================
+# Logit-space blend
+# =====================================================
+
+def logit(p):
+    p = np.clip(np.asarray(p, dtype=np.float64), EPS, 1.0 - EPS)
+    return np.log(p) - np.log1p(-p)
+
+
+class LogitBlend:
+    """
+    Blend in log-odds space:
+
+        logit(P_post) = w_model × logit(P_model) + w_market × logit(P_market) + bias
+
+    fitted as a three-parameter logistic regression by Newton's method. Each
+    iteration is one pass over the data plus a 3 × 3 solve, and it converges
+    in a handful of iterations even on millions of games.
+    """
+
+    def __init__(self, w_model, w_market, bias):
+        self.w_model = float(w_model)
+        self.w_market = float(w_market)
+        self.bias = float(bias)
+
+    def __repr__(self):
+        return f"LogitBlend(w_model={self.w_model:.4f}, w_market={self.w_market:.4f}, bias={self.bias:.4f})"
+
+    def __call__(self, p_model, p_market):
+        z = self.w_model * logit(p_model) + self.w_market * logit(p_market) + self.bias
+        return 1.0 / (1.0 + np.exp(-z))
+
+    @classmethod
+    def fit(cls, p_model, p_market, y, l2=1e-6, max_iter=25, tol=1e-10):
+        y = np.asarray(y, dtype=np.float64)
+        Z = np.column_stack([logit(p_model), logit(p_market), np.ones(len(y))])
+        # the Hessian only needs the 6 distinct products of Z's columns, so
+        # precompute them once and each iteration is two matrix-vector products
+        rows, cols = np.triu_indices(3)
+        products = Z[:, rows] * Z[:, cols]
+        # start from "trust the market" rather than zero: fewer iterations
+        w = np.array([0.0, 1.0, 0.0])
+        ridge = l2 * np.diag([1.0, 1.0, 0.0])
+        hess = np.empty((3, 3))
+        for _ in range(max_iter):
+            p = 1.0 / (1.0 + np.exp(-(Z @ w)))
+            grad = (p - y) @ Z + ridge @ w
+            hess[rows, cols] = (p * (1.0 - p)) @ products
+            hess[cols, rows] = hess[rows, cols]
+            step = np.linalg.solve(hess + ridge, grad)
+            w -= step
+            if np.abs(step).max() < tol:
+                break
+        return cls(*w)
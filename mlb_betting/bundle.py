@@ -0,0 +1,152 @@
+# MLB Betting Model v3.1 — Model Artifact Bundle
+# ------------------------------------------------------
+# One versioned file holding everything a scoring worker needs: the
+# logistic coefficients and intercept, the isotonic calibration table,
+# the blend (α or logit-blend weights), the de-vig method and the
+# feature order.
+#
+# Layout (all integers little-endian):
+#
+#   offset 0   b"MLBMODEL"                 magic
+#          8   uint32 format version
+#         12   uint32 header length
+#         16   JSON header                 scalars, features, array directory
+#          …   arrays, each starting on a 64-byte boundary
+#
+# `ModelBundle.load` maps the file read-only and hands out NumPy views
+# into the mapping, so loading costs one open + one small JSON parse and
+# every worker shares the same physical pages. Nothing is unpickled and
+# sklearn is never imported.
+# ------------------------------------------------------
+
+import json
+import math
+import mmap
+import struct
+
+import numpy as np
+
+from . import __version__
+from .blending import LogitBlend
+from .calibration import IsotonicTable
+from .scorer import LogisticScorer
+
+MAGIC = b"MLBMODEL"
+FORMAT_VERSION = 1
+ALIGN = 64
+_PREFIX = struct.Struct("<8sII")
+
+
+def _aligned(offset):
+    return -(-offset // ALIGN) * ALIGN
+
+
+def is_bundle(path):
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class ModelBundle:
+    def __init__(self, scorer, calibration, alpha=0.7, logit_blend=None,
+                 devig_method="multiplicative", metadata=None):
+        if np.ndim(alpha) != 0:
+            raise ValueError("a bundle holds one scalar α; per-segment α tables are not supported")
+        self.scorer = scorer
+        self.calibration = calibration
+        self.alpha = float(alpha)
+        self.logit_blend = logit_blend
+        self.devig_method = devig_method
+        self.metadata = dict(metadata or {})
+
+    def __repr__(self):
+        blend = self.logit_blend if self.logit_blend is not None else f"alpha={self.alpha:.3f}"
+        return (f"ModelBundle(features={list(self.features)}, knots={len(self.calibration)}, "
+                f"{blend}, devig={self.devig_method!r})")
+
+    @property
+    def features(self):
+        return self.scorer.features
+
+    def slate_scorer(self, **kwargs):
+        """`SlateScorer` over this bundle; kwargs are its staking parameters."""
+        from .slate import SlateScorer
+
+        return SlateScorer(self.scorer, self.calibration, alpha=self.alpha,
+                           logit_blend=self.logit_blend, devig_method=self.devig_method, **kwargs)
+
+    # =====================================================
+    # On-disk format
+    # =====================================================
+
+    def save(self, path):
+        arrays = {
+            "coef": self.scorer.coef,
+            "thresholds": self.calibration.thresholds,
+            "values": self.calibration.values,
+            "slopes": self.calibration.slopes,
+        }
+        header = {
+            "package_version": __version__,
+            "features": list(self.features),
+            "intercept": self.scorer.intercept,
+            "alpha": self.alpha,
+            "logit_blend": None if self.logit_blend is None else {
+                "w_model": self.logit_blend.w_model,
+                "w_market": self.logit_blend.w_market,
+                "bias": self.logit_blend.bias,
+            },
+            "devig_method": self.devig_method,
+            "metadata": self.metadata,
+        }
+        # the directory's offsets depend on the header's own length, so lay
+        # the arrays out after a provisional header and repeat until stable
+        directory = {}
+        offset = 0
+        while True:
+            header["arrays"] = directory
+            encoded = json.dumps(header, sort_keys=True).encode()
+            start = _aligned(_PREFIX.size + len(encoded))
+            if start == offset:
+                break
+            offset, position, directory = start, start, {}
+            for name, a in arrays.items():
+                a = np.ascontiguousarray(a, dtype="<f8")
+                directory[name] = {"offset": position, "dtype": a.dtype.str, "shape": list(a.shape)}
+                position = _aligned(position + a.nbytes)
+
+        with open(path, "wb") as f:
+            f.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, len(encoded)))
+            f.write(encoded)
+            for name, a in arrays.items():
+                f.write(b"\0" * (directory[name]["offset"] - f.tell()))
+                f.write(np.ascontiguousarray(a, dtype="<f8").tobytes())
+
+    @classmethod
+    def load(cls, path, mmap_mode=True):
+        """Open a bundle; with `mmap_mode` the arrays are read-only views of the mapped file."""
+        with open(path, "rb") as f:
+            if mmap_mode:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                buffer = f.read()
+        magic, version, header_len = _PREFIX.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a model bundle")
+        if version > FORMAT_VERSION:
+            raise ValueError(f"{path} is bundle format v{version}; this build reads up to v{FORMAT_VERSION}")
+        header = json.loads(bytes(buffer[_PREFIX.size:_PREFIX.size + header_len]))
+
+        arrays = {}
+        for name, spec in header["arrays"].items():
+            count = math.prod(spec["shape"])
+            arrays[name] = np.frombuffer(buffer, dtype=spec["dtype"], count=count,
+                                         offset=spec["offset"]).reshape(spec["shape"])
+
+        blend = header["logit_blend"]
+        return cls(LogisticScorer(arrays["coef"], [header["intercept"]], header["features"]),
+                   IsotonicTable(arrays["thresholds"], arrays["values"], arrays["slopes"]),
+                   alpha=header["alpha"],
+                   logit_blend=None if blend is None else LogitBlend(**blend),
+                   devig_method=header["devig_method"],
+                   metadata=dict(header["metadata"], package_version=header["package_version"],
+                                 format_version=version))
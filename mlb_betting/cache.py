@@ -0,0 +1,93 @@
+# MLB Betting Model v3.1 — Content-Hash Model Cache
+# ------------------------------------------------------
+# Fitted artifacts (base model, calibrator, …) are stored on disk under a
+# SHA-256 of everything that determines them:
+#   • the training arrays (dtype, shape and raw bytes)
+#   • the hyperparameters (as canonical JSON)
+#   • the code version: package version, scikit-learn version and a hash
+#     of the source of the modules that fit artifacts (TRAINING_MODULES),
+#     so editing training code without bumping __version__ still misses
+# If the same key is requested again the artifact is loaded instead of
+# refitted; any change to data, parameters or code produces a new key.
+# ------------------------------------------------------
+
+import functools
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+
+import numpy as np
+
+from . import __version__
+
+
+# modules whose code decides what a cached artifact contains
+TRAINING_MODULES = ("cache", "calibration", "demo", "design", "oof", "online", "scorer")
+
+
+def source_hash(modules=TRAINING_MODULES, package_dir=None):
+    """Short SHA-256 over the source files of the given mlb_betting modules."""
+    h = hashlib.sha256()
+    package_dir = package_dir or os.path.dirname(os.path.abspath(__file__))
+    for name in modules:
+        h.update(name.encode())
+        with open(os.path.join(package_dir, f"{name}.py"), "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()[:16]
+
+
+@functools.lru_cache(maxsize=None)
+def code_version():
+    # the running process's code cannot change, so hash it once
+    version = f"mlb_betting-{__version__}+{source_hash()}"
+    try:
+        import sklearn
+        return f"{version}/sklearn-{sklearn.__version__}"
+    except ImportError:
+        return version
+
+
+def artifact_key(*arrays, params=None, version=None):
+    """Hex SHA-256 over the arrays, the hyperparameters and the code version."""
+    h = hashlib.sha256()
+    for a in arrays:
+        a = np.ascontiguousarray(a)
+        h.update(f"{a.dtype.str}{a.shape}".encode())
+        h.update(a.data)
+    h.update(json.dumps(params or {}, sort_keys=True, default=str).encode())
+    h.update((version or code_version()).encode())
+    return h.hexdigest()
+
+
+class ModelCache:
+    def __init__(self, cache_dir=".mlb_cache"):
+        self.cache_dir = cache_dir
+
+    def path(self, name, key):
+        return os.path.join(self.cache_dir, f"{name}-{key[:24]}.pkl")
+
+    def load(self, name, key):
+        try:
+            with open(self.path(name, key), "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+
+    def store(self, name, key, artifact):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # write-then-rename so concurrent runs never read a half-written file
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, self.path(name, key))
+
+    def get_or_fit(self, name, key, fit):
+        """(artifact, hit): the cached artifact for `key`, or `fit()`'s result, stored."""
+        artifact = self.load(name, key)
+        if artifact is not None:
+            return artifact, True
+        artifact = fit()
+        self.store(name, key, artifact)
+        return artifact, False
@@ -0,0 +1,87 @@
+# MLB Betting Model v3.1 — Isotonic Lookup Table
+# ------------------------------------------------------
+# A fitted IsotonicRegression is a piecewise-linear curve through a
+# sorted set of knots. `export_isotonic` pulls the knots out of the
+# sklearn model once (X_thresholds_, y_thresholds_); `IsotonicTable`
+# then calibrates with one `np.searchsorted` and a linear interpolation
+# written into the output buffer — no sklearn input validation — and
+# matches `IsotonicRegression(out_of_bounds="clip").predict` to
+# floating-point round-off. The segment indices and the knots gathered
+# at them are temporary arrays of len(p), so a call is not
+# allocation-free even with `out=`.
+#
+# The knots are saved as a single 2 × n .npy array, so scoring workers
+# can `load(path, mmap=True)` and share one copy through the page cache.
+# Output is float64 unless `dtype=` (or `out=`) asks for float32.
+# Only NumPy is imported here.
+# ------------------------------------------------------
+
+import numpy as np
+
+from .precision import resolve_dtype
+
+
+class IsotonicTable:
+    def __init__(self, thresholds, values, slopes=None):
+        self.thresholds = np.asarray(thresholds, dtype=np.float64)
+        self.values = np.asarray(values, dtype=np.float64)
+        if self.thresholds.ndim != 1 or self.thresholds.shape != self.values.shape:
+            raise ValueError("thresholds and values must be 1-D arrays of equal length")
+        if len(self.thresholds) == 0:
+            raise ValueError("empty isotonic table")
+        if slopes is not None:
+            # precomputed by an earlier table (e.g. read back from a bundle)
+            self.slopes = np.asarray(slopes, dtype=np.float64)
+            return
+        dx = np.diff(self.thresholds)
+        if np.any(dx < 0):
+            raise ValueError("thresholds must be sorted")
+        # slope of each segment [x_k, x_k+1]; flat where knots coincide
+        dy = np.diff(self.values)
+        self.slopes = np.divide(dy, dx, out=np.zeros_like(dy), where=dx > 0)
+
+    def __len__(self):
+        return len(self.thresholds)
+
+    def __repr__(self):
+        return f"IsotonicTable(knots={len(self)})"
+
+    def transform(self, p, out=None, dtype=None):
+        """Calibrated probability for every entry of `p` (clipped to the table's range)."""
+        dtype = resolve_dtype(dtype, out)
+        p = np.asarray(p, dtype=dtype)
+        if out is None:
+            out = np.empty(p.shape, dtype=dtype)
+        x, v = self.thresholds, self.values
+        # bounds in the working dtype; in float32 they may round to just
+        # outside [x_0, x_last], so the segment index is clamped at both ends
+        np.clip(p, dtype.type(x[0]), dtype.type(x[-1]), out=out)
+        if len(x) == 1:
+            out.fill(v[0])
+            return out
+        k = np.searchsorted(x, out, side="right")
+        k -= 1
+        np.clip(k, 0, len(x) - 2, out=k)
+        # v_k + slope_k · (p − x_k), accumulated in `out` (x[k], slopes[k]
+        # and v[k] are temporaries, like k itself)
+        out -= x[k]
+        out *= self.slopes[k]
+        out += v[k]
+        return out
+
+    predict = transform
+
+    def save(self, path):
+        np.save(path, np.vstack([self.thresholds, self.values]))
+
+    @classmethod
+    def load(cls, path, mmap=False):
+        table = np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False)
+        return cls(table[0], table[1])
+
+
+def export_isotonic(model):
+    """`IsotonicTable` from a fitted sklearn IsotonicRegression."""
+    if getattr(model, "out_of_bounds", "clip") != "clip":
+        raise ValueError("only out_of_bounds='clip' calibrators can be exported")
+    return IsotonicTable(model.X_thresholds_, model.y_thresholds_)
@@ -0,0 +1,145 @@
+# MLB Betting Model v3.1 — Command Line
+# ------------------------------------------------------
+#   mlb-betting demo      full v1 → v3 model-building demo
+#   mlb-betting results   recommended-bets results & ROI demo
+#   mlb-betting odds      convert prices between odds formats
+#   mlb-betting score     score a slate CSV with an exported model or bundle
+#
+# Only argparse is imported up front; each command imports what it needs
+# when it runs, so `odds` and `score` start without pandas or sklearn.
+# ------------------------------------------------------
+
+import argparse
+import sys
+
+
+def _demo(args):
+    from .demo import main as demo_main
+
+    demo_main(n_games=args.games, model_mode=args.model_mode, alpha_mode=args.alpha_mode,
+              alpha=args.alpha, blend_mode=args.blend_mode, devig_method=args.devig_method,
+              export_model=args.export_model, cache_dir=None if args.no_cache else args.cache_dir,
+              evaluation=args.evaluation.replace("-", "_"), n_jobs=args.jobs, residual=args.residual,
+              export_bundle=args.export_bundle, precision=args.precision,
+              feature_store=args.feature_store, show_memory=args.memory_report)
+
+
+def _results(args):
+    from .results import main as results_main
+
+    results_main(show_memory=args.memory_report)
+
+
+def _odds(args):
+    import numpy as np
+
+    from . import odds
+
+    prices = np.array(args.prices, dtype=np.float64)
+    if args.from_format == "american":
+        decimal = odds.american_to_decimal(prices)
+    elif args.from_format == "decimal":
+        decimal = prices
+    else:
+        decimal = odds.prob_to_decimal(prices)
+    american = odds.decimal_to_american(decimal)
+    num, den = odds.decimal_to_fractional(decimal)
+    prob = odds.decimal_to_prob(decimal)
+
+    print(f"{'american':>10} {'decimal':>9} {'fractional':>11} {'implied':>8}")
+    for a, d, n, k, p in zip(american, decimal, num, den, prob):
+        print(f"{a:>+10.0f} {d:>9.3f} {f'{n}/{k}':>11} {p:>8.4f}")
+
+
+def _score(args):
+    import csv
+
+    import numpy as np
+
+    from .bundle import ModelBundle, is_bundle
+    from .scorer import LogisticScorer
+
+    bundle = ModelBundle.load(args.model) if is_bundle(args.model) else None
+    scorer = bundle.scorer if bundle is not None else LogisticScorer.load(args.model)
+    odds_columns = ["away_moneyline", "home_moneyline"]
+    with open(args.slate, newline="") as f:
+        header = next(csv.reader(f))
+        missing = [name for name in scorer.features if name not in header]
+        if missing:
+            sys.exit(f"slate is missing feature columns: {', '.join(missing)}")
+        # a bundle scores the full chain when the slate carries both sides' prices
+        with_odds = bundle is not None and all(name in header for name in odds_columns)
+        names = list(scorer.features) + (odds_columns if with_odds else [])
+        table = np.loadtxt(f, delimiter=",", usecols=[header.index(name) for name in names], ndmin=2)
+        X = np.ascontiguousarray(table[:, :len(scorer.features)])
+
+    writer = csv.writer(sys.stdout)
+    if with_odds:
+        records = bundle.slate_scorer().score_slate(X, table[:, len(scorer.features):])
+        writer.writerow(["row", *records.dtype.names])
+        writer.writerows((i, *(f"{v:.6f}" for v in r)) for i, r in enumerate(records.tolist()))
+        return
+    p = scorer.predict_proba(X)
+    if bundle is None:
+        writer.writerow(["row", "p_base"])
+        writer.writerows((i, f"{v:.6f}") for i, v in enumerate(p))
+    else:
+        calibrated = bundle.calibration.transform(p)
+        writer.writerow(["row", "p_base", "p_calibrated"])
+        writer.writerows((i, f"{v:.6f}", f"{c:.6f}") for i, (v, c) in enumerate(zip(p, calibrated)))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="mlb-betting", description="MLB Betting Model v3.1")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    demo = commands.add_parser("demo", help="run the v1 → v3 model-building demo")
+    demo.add_argument("--games", type=int, default=250)
+    demo.add_argument("--model-mode", choices=["batch", "online"], default="batch")
+    demo.add_argument("--alpha-mode", choices=["cv", "segmented", "fixed"], default="cv")
+    demo.add_argument("--alpha", type=float, default=0.7, help="blend weight for --alpha-mode fixed")
+    demo.add_argument("--blend-mode", choices=["linear", "logit"], default="linear")
+    demo.add_argument("--devig-method", choices=["multiplicative", "additive", "power", "shin"],
+                      default="multiplicative")
+    demo.add_argument("--export-model", metavar="PATH", help="save the base model scorer (.npz)")
+    demo.add_argument("--export-bundle", metavar="PATH", help="save the versioned model bundle (.mlbm)")
+    demo.add_argument("--cache-dir", default=".mlb_cache", help="content-hash cache of fitted models")
+    demo.add_argument("--no-cache", action="store_true", help="always refit")
+    demo.add_argument("--evaluation", choices=["in-sample", "oof"], default="in-sample",
+                      help="report in-sample or out-of-fold (honest) probabilities")
+    demo.add_argument("--jobs", type=int, default=1, help="processes for the out-of-fold fits (-1 = all cores)")
+    demo.add_argument("--residual", action="store_true", help="add the GBM residual learner stage (v4)")
+    demo.add_argument("--precision", choices=["float64", "float32"], default="float64",
+                      help="width of the feature, probability, EV and Kelly columns")
+    demo.add_argument("--feature-store", metavar="DIR",
+                      help="append the delta features to this date-partitioned store and train from it")
+    demo.add_argument("--memory-report", action="store_true",
+                      help="print each frame's memory against plain object / int64 / float64 dtypes")
+    demo.set_defaults(func=_demo)
+
+    results = commands.add_parser("results", help="run the recommended-bets results demo")
+    results.add_argument("--memory-report", action="store_true",
+                         help="print each frame's memory against plain object / int64 / float64 dtypes")
+    results.set_defaults(func=_results)
+
+    odds = commands.add_parser("odds", help="convert prices between odds formats")
+    odds.add_argument("prices", nargs="+", type=float)
+    odds.add_argument("--from", dest="from_format", choices=["american", "decimal", "prob"],
+                      default="american")
+    odds.set_defaults(func=_odds)
+
+    score = commands.add_parser("score", help="score a slate CSV with an exported model")
+    score.add_argument("model", help="bundle from `demo --export-bundle` or scorer from `demo --export-model`")
+    score.add_argument("slate", help="CSV with a header row containing the model's feature columns "
+                                     "(and away_moneyline/home_moneyline for a full bundle score)")
+    score.set_defaults(func=_score)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
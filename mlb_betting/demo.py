@@ -0,0 +1,355 @@
+# MLB Betting Model v3.1 (Accuracy-Enhanced Demo)
+# Author: Hrishikesh Kochale
+# ------------------------------------------------------
+# This module demonstrates the full model-building process:
+# 1️⃣ Base logistic model
+# 2️⃣ Calibration (Platt Scaling)
+# 3️⃣ Market blending
+# 4️⃣ Performance evaluation (Brier, log-loss, accuracy)
+# 5️⃣ EV & Kelly analysis
+#
+# It’s structured to show how each version improves accuracy
+# — from uncalibrated v1 → blended v3.
+#
+# ⚠️ DISCLAIMER:
+# ------------------------------------------------------
+# This code is intended strictly for educational and research purposes.
+# It uses simplified synthetic data to illustrate how probabilistic models,
+# calibration, and expected value concepts are applied in sports analytics.
+#
+# Various factors such as lineup changes, injuries, weather, and market movement
+# can drastically alter real-world outcomes. Therefore, this model should NEVER
+# be used for actual betting or financial decision-making.
+# ------------------------------------------------------
+
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+from sklearn.isotonic import IsotonicRegression
+from sklearn.metrics import brier_score_loss, log_loss, accuracy_score
+from sklearn.model_selection import train_test_split
+
+from .best_line import BestLineIndex
+from .bundle import ModelBundle
+from .calibration import export_isotonic
+from .cache import ModelCache, artifact_key
+from .blending import BlendCV, LogitBlend, SegmentedAlpha, blend_linear
+from .design import DesignMatrix
+from .feature_store import FeatureStore
+from .incremental import IncrementalBlender
+from .kelly import ev_kelly
+from .odds import american_to_decimal
+from .online import OnlineLogistic, drift_check
+from .oof import out_of_fold
+from .portfolio import SimultaneousKelly
+from .precision import resolve_dtype
+from .residual import ResidualLearner
+from .scorer import export_logistic
+from .schema import apply_schema, games_schema, memory_report
+from .slate import SlateScorer
+from .synthetic import finish_games, game_dates, game_months
+from .tick_store import Tick, TickStore
+
+FEATURES = ["delta_xfip", "delta_kbb", "delta_wrc", "delta_park"]
+
+
+# =====================================================
+# 1. Simulated Historical Data
+# =====================================================
+
+def simulate_games(n_games=250, seed=42, dtype=np.float64):
+    np.random.seed(seed)
+
+    df = pd.DataFrame({
+        "away_sp_xfip": np.random.normal(3.8, 0.4, n_games),
+        "home_sp_xfip": np.random.normal(3.9, 0.4, n_games),
+        "away_sp_kbb": np.random.normal(18, 2.5, n_games),
+        "home_sp_kbb": np.random.normal(17, 2.5, n_games),
+        "away_wrc_plus_vs_hand": np.random.normal(108, 10, n_games),
+        "home_wrc_plus_vs_hand": np.random.normal(104, 10, n_games),
+        "park_factor": np.random.normal(100, 3, n_games),
+        "away_moneyline": np.random.choice([-120, -130, -110, 100, 110], n_games)
+    })
+
+    df["actual_outcome"] = (np.random.rand(n_games) > 0.47).astype(int)
+    df["game_id"] = np.arange(n_games)
+    # 15 games a day from opening day, for the date-partitioned feature store
+    df["date"] = game_dates(df["game_id"])
+    df["month"] = game_months(df["game_id"])
+
+    # home moneyline and column dtypes — shared with the
+    # streaming generator (synthetic.iter_games) used for load tests
+    return finish_games(df, dtype)
+
+
+# =====================================================
+# Demo run
+# =====================================================
+
+def _cached(cache, hits, name, arrays, params, fit):
+    # fit, or load the artifact fitted on identical inputs by an earlier run
+    if cache is None:
+        return fit()
+    artifact, hits[name] = cache.get_or_fit(name, artifact_key(*arrays, params=params), fit)
+    return artifact
+
+
+def main(n_games=250, model_mode="batch", alpha_mode="cv", alpha=0.7, blend_mode="linear",
+         devig_method="multiplicative", export_model=None, cache_dir=".mlb_cache",
+         evaluation="in_sample", n_jobs=1, residual=False,
+         export_bundle=None, precision="float64", feature_store=None, show_memory=False):
+    """
+    Run the full v1 → v3 demo and print each stage.
+
+    model_mode:   "batch" fits LogisticRegression from scratch, "online" folds
+                  the training games in one day (15 games) at a time
+    alpha_mode:   "cv" learns α on out-of-fold predictions, "segmented"
+                  learns one α per odds bucket × month, "fixed" uses `alpha`
+    blend_mode:   "linear" α-blend, or "logit" (weighted log-odds + bias)
+    devig_method: "multiplicative", "additive", "power" or "shin"
+    export_model: path to save the base model's NumPy scorer (.npz)
+    export_bundle: path to save the versioned model bundle for scoring workers
+    cache_dir:    where fitted models are cached by content hash (None = off)
+    evaluation:   "in_sample" scores the games the models were fitted on,
+                  "oof" reports out-of-fold (honest) v1/v2/v3 probabilities
+    n_jobs:       worker processes for the out-of-fold fits (-1 = all cores)
+    residual:     fit the residual learner (v4) on the training split and
+                  compare it with v3 on the held-out games
+    precision:    "float64", or "float32" for the features, probabilities,
+                  EV and Kelly columns (half the memory)
+    feature_store: directory of the date-partitioned feature store; the
+                  slate's delta features are appended to it and the model
+                  trains on the columns read back
+    show_memory:  print each frame's memory next to plain object / int64 /
+                  float64 dtypes
+    """
+    cache = ModelCache(cache_dir) if cache_dir else None
+    cache_hits = {}
+    features = FEATURES
+    dtype = resolve_dtype(precision)
+    df = simulate_games(n_games, dtype=dtype)
+    # one C-contiguous (n, 4) matrix, the deltas written straight from the
+    # raw columns, shared by sklearn, the scorers and the OOF fits
+    design = DesignMatrix(features, dtype)
+    X = design.build(df)
+    if feature_store is not None:
+        fstore = FeatureStore(feature_store)
+        days = fstore.append({"game_id": df["game_id"], "date": df["date"], **dict(zip(features, X.T))},
+                             features)
+        stored = fstore.read(features, start=days[0], end=days[-1])
+        order = np.argsort(stored["game_id"], kind="stable")
+        # train on the columns read back, in game order
+        X = design.build(stored).take(order, axis=0)
+        print(f"\nFeature store: {len(days)} daily partitions appended, "
+              f"{len(features)} columns × {len(order)} games read back")
+    y = df["actual_outcome"]
+
+    if evaluation == "oof" or alpha_mode != "fixed" or blend_mode == "logit":
+        # OOF probabilities are computed once; every candidate α (or the logit
+        # blend) is then fitted with vector ops over them, all folds at once
+        oof = out_of_fold(X, y, n_splits=5, seed=42, n_jobs=n_jobs)
+    label = " (out-of-fold)" if evaluation == "oof" else ""
+
+    # =====================================================
+    # 2. Base Logistic Model (v1)
+    # =====================================================
+
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.25, random_state=42)
+    if model_mode == "online":
+        online = OnlineLogistic(len(features))
+        for day in np.array_split(np.arange(len(X_train)), max(1, len(X_train) // 15)):
+            online.partial_fit(X_train[day], y_train.iloc[day])
+        drift = drift_check(online, X_train, y_train)
+        print(f"\nOnline model: {online.n_seen} games folded in daily | "
+              f"max |Δp| vs full refit {drift.max_prob_diff:.5f}{' (drifted)' if drift.drifted else ''}")
+        scorer = online.to_scorer(features)
+    else:
+        base_model = _cached(cache, cache_hits, "base_model", (X_train, y_train.to_numpy()),
+                             {"features": features, **LogisticRegression().get_params()},
+                             lambda: LogisticRegression().fit(X_train, y_train))
+        # Score through the exported NumPy scorer: same probabilities as
+        # base_model.predict_proba, without sklearn's per-call overhead
+        scorer = export_logistic(base_model, features)
+
+    p_base = scorer.predict_proba(X, dtype=dtype)
+    df["p_base"] = oof.p_base if evaluation == "oof" else p_base
+
+    brier_v1 = brier_score_loss(y, df["p_base"])
+    logloss_v1 = log_loss(y, df["p_base"])
+    acc_v1 = accuracy_score(y, (df["p_base"] > 0.5).astype(int))
+
+    print(f"\n=== Base Model (v1) Performance{label} ===")
+    print(f"Brier Score: {brier_v1:.3f} | Log Loss: {logloss_v1:.3f} | Accuracy: {acc_v1:.3f}")
+
+    # =====================================================
+    # 3. Calibration Step (v2 - Platt Scaling / Isotonic)
+    # =====================================================
+
+    calibrator = _cached(cache, cache_hits, "calibrator", (p_base, y.to_numpy()),
+                         {"out_of_bounds": "clip"},
+                         lambda: IsotonicRegression(out_of_bounds="clip").fit(p_base, y))
+    # apply through the exported lookup table (same curve, no sklearn per call)
+    calibration = export_isotonic(calibrator)
+    df["p_calibrated"] = oof.p_calibrated if evaluation == "oof" else calibration.transform(p_base, dtype=dtype)
+
+    brier_v2 = brier_score_loss(y, df["p_calibrated"])
+    logloss_v2 = log_loss(y, df["p_calibrated"])
+    acc_v2 = accuracy_score(y, (df["p_calibrated"] > 0.5).astype(int))
+
+    if cache_hits:
+        print("\nModel cache: " + " | ".join(f"{name} {'loaded' if hit else 'fitted'}"
+                                           for name, hit in cache_hits.items()))
+
+    print(f"\n=== Calibrated Model (v2) Performance{label} ===")
+    print(f"Brier Score: {brier_v2:.3f} | Log Loss: {logloss_v2:.3f} | Accuracy: {acc_v2:.3f}")
+
+    # =====================================================
+    # 4. Market Blending (v3)
+    # =====================================================
+
+    # Latest quotes live in the tick store and the best-line index; in
+    # production both are fed by the live feed (see replay.py), here by the
+    # single simulated line per game.
+    store = TickStore(capacity=64)
+    best_lines = BestLineIndex()
+    for game_id, away, home in zip(df["game_id"], df["away_moneyline"], df["home_moneyline"]):
+        tick = Tick(0.0, game_id, "demo_book", "moneyline", (away, home))
+        store.append_tick(tick)
+        best_lines.update_tick(tick)
+
+    df["p_market"] = store.p_market(df["game_id"], "demo_book", method=devig_method).astype(dtype)
+
+    logit_blend = None
+    if blend_mode == "logit":
+        logit_blend = LogitBlend.fit(oof.p_calibrated, df["p_market"], y)
+        print(f"\nLogit blend: {logit_blend}")
+        df["p_blended"] = logit_blend(df["p_calibrated"], df["p_market"]).astype(dtype)
+    else:
+        if alpha_mode == "cv":
+            alpha_fit = BlendCV(oof.p_calibrated, df["p_market"], y, oof.fold).fit("golden")
+            alpha = alpha_fit.alpha
+            print(f"\nCross-validated α: {alpha:.3f} (per fold: {np.round(alpha_fit.fold_alphas, 2)})")
+        elif alpha_mode == "segmented":
+            segmented_alpha = SegmentedAlpha.fit(oof.p_calibrated, df["p_market"], y, df["month"])
+            alpha = segmented_alpha(df["p_market"], df["month"], segmented_alpha.market_codes("moneyline"))
+            print(f"\nSegmented α: {segmented_alpha.table.size} segments, "
+                  f"range {alpha.min():.3f}–{alpha.max():.3f}")
+        df["p_blended"] = blend_linear(df["p_calibrated"], df["p_market"], alpha).astype(dtype)
+
+    brier_v3 = brier_score_loss(y, df["p_blended"])
+    logloss_v3 = log_loss(y, df["p_blended"])
+    acc_v3 = accuracy_score(y, (df["p_blended"] > 0.5).astype(int))
+
+    print(f"\n=== Market-Blended Model (v3.1) Performance{label} ===")
+    print(f"Brier Score: {brier_v3:.3f} | Log Loss: {logloss_v3:.3f} | Accuracy: {acc_v3:.3f}")
+
+    if residual:
+        # GBM on y − p_blended: fitted on the training split, judged on the rest
+        learner = ResidualLearner().fit(X_train, y_train, df.loc[y_train.index, "p_blended"])
+        p_v3_test = df.loc[y_test.index, "p_blended"]
+        p_v4_test = learner.predict_proba(X_test, p_v3_test)
+        print(f"\n=== Residual Learner (v4) on {len(X_test)} held-out games ===")
+        print(f"Trees: {learner.n_trees} (early stopping) | "
+              f"Brier v3 {brier_score_loss(y_test, p_v3_test):.3f} → v4 {brier_score_loss(y_test, p_v4_test):.3f} | "
+              f"Log Loss v3 {log_loss(y_test, p_v3_test):.3f} → v4 {log_loss(y_test, p_v4_test):.3f}")
+
+    # =====================================================
+    # 5. EV and Kelly Evaluation Example
+    # =====================================================
+
+    kelly_multiplier = 0.5  # ½-Kelly
+    max_stake = 0.05        # never more than 5% of bankroll on one bet
+    min_edge = 0.0          # only bet positive EV
+
+    # Score the whole slate at once against the best available lines
+    best_odds = best_lines.best_american([(g, "moneyline", "away") for g in df["game_id"]])
+    scored = ev_kelly(df["p_blended"], best_odds, kelly_multiplier=kelly_multiplier,
+                      max_stake=max_stake, min_edge=min_edge, dtype=dtype)
+    df["best_odds"] = best_odds
+    df["ev"] = scored.ev
+    df["kelly"] = scored.kelly
+    df["stake"] = scored.stake
+    apply_schema(df, games_schema(dtype))
+
+    sample = df.sample(1, random_state=2).iloc[0]
+    best = best_lines.best(sample.game_id, "moneyline", "away")
+
+    print("\n=== EV / Kelly Example ===")
+    print(f"Game Example Odds: {best.american} ({best.book})")
+    print(f"Blended Probability: {sample.p_blended:.3f}")
+    print(f"Expected Value per $: {sample.ev:.3f}")
+    print(f"Kelly Fraction: {sample.kelly:.3f} | ½-Kelly Stake: {sample.stake:.3f}")
+    print(f"All games: {(df['stake'] > 0).sum()} of {n_games} bet, "
+          f"mean stake {df.loc[df['stake'] > 0, 'stake'].mean():.3f} of bankroll")
+
+    # The game-day service runs the whole chain in one pass per slate
+    slate_scorer = SlateScorer(scorer, calibration, alpha=alpha, logit_blend=logit_blend,
+                               devig_method=devig_method, kelly_multiplier=kelly_multiplier,
+                               max_stake=max_stake, min_edge=min_edge, dtype=dtype)
+    market_odds = df[["away_moneyline", "home_moneyline"]].to_numpy()
+    records = np.empty(len(df), dtype=slate_scorer.record_dtype)
+    start = time.perf_counter()
+    slate_scorer.score_slate(X, market_odds, bet_odds=best_odds, out=records)
+    print(f"One-pass slate scoring: {records['stake'].astype(bool).sum()} bets, "
+          f"latency {(time.perf_counter() - start) * 1e6:.1f} µs for {len(records)} games")
+
+    # Concurrent bets share one bankroll: size a 15-game slate jointly
+    slate = df.head(15)
+    allocation = SimultaneousKelly(kelly_multiplier=kelly_multiplier).solve(
+        slate["p_blended"], american_to_decimal(slate["best_odds"].to_numpy()),
+        groups=slate["game_id"], bet_ids=slate["game_id"])
+    print(f"15-Game Slate: independent ½-Kelly total {kelly_multiplier * slate['kelly'].sum():.3f} | "
+          f"simultaneous ½-Kelly total {allocation.stakes.sum():.3f}")
+
+    # When one line moves, only that game's chain is recomputed and published
+    blender = IncrementalBlender(df["game_id"], df["p_calibrated"], alpha, best_lines, devig_method,
+                                 logit_blend=logit_blend)
+    delta = blender.on_tick(Tick(1.0, sample.game_id, "demo_book", "moneyline", (-120, 100)))
+
+    print("\n=== Line Move (-120 / +100) ===")
+    print(f"Blended Probability: {delta.p_blended:.3f} | EV per $: {delta.ev:.3f} | "
+          f"Kelly: {delta.kelly:.3f} | Update latency: {delta.latency_us:.1f} µs")
+
+    # =====================================================
+    # 6. Comparison Summary
+    # =====================================================
+
+    summary = pd.DataFrame({
+        "Model": ["Base v1", "Calibrated v2", "Blended v3"],
+        "Brier Score ↓": [brier_v1, brier_v2, brier_v3],
+        "Log Loss ↓": [logloss_v1, logloss_v2, logloss_v3],
+        "Accuracy ↑": [acc_v1, acc_v2, acc_v3]
+    })
+
+    print("\n=== Model Evolution Summary ===")
+    print(summary.to_string(index=False))
+
+    print("\n✅ Accuracy improved step-by-step:")
+    print("• v1 → v2: Calibration reduced overconfidence.")
+    print("• v2 → v3: Market blending improved realism and EV stability.")
+    print("• Kelly & EV provide risk-aware decision metrics.")
+    print("\nEnd of script — MLB Betting Model v3.1 (Accuracy Enhanced Demo)")
+
+    if show_memory:
+        print("\n=== Memory ===")
+        print(memory_report({"games": df, "summary": summary}).to_string(index=False, float_format="%.1f"))
+
+    if export_model is not None:
+        scorer.save(export_model)
+        print(f"\n✅ Base model exported to {export_model}")
+
+    if export_bundle is not None:
+        if np.ndim(alpha) == 0:
+            ModelBundle(scorer, calibration, alpha=alpha, logit_blend=logit_blend, devig_method=devig_method,
+                        metadata={"n_games": n_games, "model_mode": model_mode,
+                                  "alpha_mode": alpha_mode, "blend_mode": blend_mode}).save(export_bundle)
+            print(f"\n✅ Model bundle exported to {export_bundle}")
+        else:
+            print("\n⚠️ Segmented α cannot be bundled; use --alpha-mode cv or fixed")
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+# MLB Betting Model v3.1 — No-Vig Fair Probability Engine
+# ------------------------------------------------------
+# Removes the bookmaker margin (vig / overround) from implied
+# probabilities for a whole slate at once.
+#
+# Input is a 2-D array of implied probabilities with one row per market
+# (game × book) and one column per outcome. Two-way markets (moneyline,
+# totals) have two columns; multi-way markets (futures, exact outcomes)
+# simply use more columns. With `padded=True`, rows with fewer outcomes
+# than the widest market are padded with NaN and the padding is carried
+# through. Otherwise a NaN is a missing price, and a market missing any
+# price (a two-way line with one side pulled, an unquoted game) comes
+# back all NaN rather than de-vigged from what is left.
+#
+# Methods:
+#   • multiplicative  p_i = q_i / Σq
+#   • additive        p_i = q_i − (Σq − 1) / n
+#   • power           p_i = q_i ** k,  k solved so Σp = 1
+#   • shin            Shin (1993) insider-trading model, z solved so Σp = 1
+#
+# The iterative methods solve every row simultaneously — the loops run
+# over solver iterations, never over games or books.
+# ------------------------------------------------------
+
+import numpy as np
+
+from .odds import american_to_prob
+
+METHODS = ("multiplicative", "additive", "power", "shin")
+
+
+def _as_matrix(implied):
+    q = np.asarray(implied, dtype=np.float64)
+    if q.ndim == 1:
+        return q[None, :], True
+    if q.ndim != 2:
+        raise ValueError(f"implied probabilities must be 1-D or 2-D, got shape {q.shape}")
+    return q, False
+
+
+def overround(implied):
+    """Bookmaker margin per market: Σq − 1."""
+    q, single = _as_matrix(implied)
+    margin = np.nansum(q, axis=1) - 1.0
+    return float(margin[0]) if single else margin
+
+
+# =====================================================
+# Methods
+# =====================================================
+
+def _multiplicative(q):
+    return q / np.nansum(q, axis=1, keepdims=True)
+
+
+def _additive(q):
+    n = np.sum(~np.isnan(q), axis=1, keepdims=True)
+    p = q - (np.nansum(q, axis=1, keepdims=True) - 1.0) / n
+    # long shots can be pushed below zero; floor them and renormalise
+    np.clip(p, 0.0, None, out=p)
+    return p / np.nansum(p, axis=1, keepdims=True)
+
+
+def _power(q, tol, max_iter):
+    # Σ q_i^k is convex and decreasing in k, so Newton from k = 1 converges
+    # monotonically for markets with a positive overround.
+    log_q = np.log(q)
+    k = np.ones((q.shape[0], 1))
+    for _ in range(max_iter):
+        p = np.exp(k * log_q)
+        f = np.nansum(p, axis=1, keepdims=True) - 1.0
+        if np.all(np.abs(f) < tol):
+            break
+        slope = np.nansum(p * log_q, axis=1, keepdims=True)
+        k -= f / slope
+    return np.exp(k * log_q)
+
+
+def _shin_probs(q, total, z):
+    return (np.sqrt(z * z + 4.0 * (1.0 - z) * q * q / total) - z) / (2.0 * (1.0 - z))
+
+
+def _shin(q, tol, max_iter):
+    # Σ p_i(z) equals √Σq at z = 0 and decreases in z, so bisect on z for
+    # all rows in lockstep.
+    total = np.nansum(q, axis=1, keepdims=True)
+    lo = np.zeros_like(total)
+    hi = np.full_like(total, 0.999)
+    for _ in range(max_iter):
+        z = 0.5 * (lo + hi)
+        excess = np.nansum(_shin_probs(q, total, z), axis=1, keepdims=True) - 1.0
+        too_low = excess > 0.0
+        lo = np.where(too_low, z, lo)
+        hi = np.where(too_low, hi, z)
+        if np.all(hi - lo < tol):
+            break
+    p = _shin_probs(q, total, 0.5 * (lo + hi))
+    # markets with no margin have z = 0 and no correction to make
+    return np.where(total <= 1.0, q / total, p)
+
+
+def _solve(q, method, tol, max_iter):
+    if method == "multiplicative":
+        return _multiplicative(q)
+    if method == "additive":
+        return _additive(q)
+    if method == "power":
+        return _power(q, tol, max_iter)
+    return _shin(q, tol, max_iter)
+
+
+# =====================================================
+# Public API
+# =====================================================
+
+def devig(implied, method="multiplicative", tol=1e-12, max_iter=100, padded=False):
+    """
+    Fair (no-vig) probabilities for every market in `implied`.
+
+    `implied` is (n_markets, n_outcomes) — or a single 1-D market — of
+    implied probabilities. Returns an array of the same shape whose rows
+    sum to 1. A row missing any price comes back all NaN; with `padded`,
+    NaN pads markets with fewer outcomes instead, and only rows with fewer
+    than two finite prices come back all NaN.
+    """
+    q, single = _as_matrix(implied)
+    if method not in METHODS:
+        raise ValueError(f"unknown de-vig method {method!r}; expected one of {METHODS}")
+    # unquoted markets (e.g. TickStore.p_market for a game with no quote,
+    # or one side pulled) stay NaN and are kept out of the solvers, so they
+    # neither warn nor hold the iterative methods to max_iter; one price
+    # alone would otherwise "de-vig" to 1
+    priced = np.isfinite(q)
+    quoted = priced.sum(axis=1) >= 2 if padded else priced.all(axis=1)
+    if quoted.all():
+        p = _solve(q, method, tol, max_iter)
+    else:
+        p = np.full_like(q, np.nan)
+        if quoted.any():
+            p[quoted] = _solve(q[quoted], method, tol, max_iter)
+    return p[0] if single else p
+
+
+def devig_american(odds, method="multiplicative", tol=1e-12, max_iter=100, padded=False):
+    """Fair probabilities straight from an (n_markets, n_outcomes) American odds array."""
+    return devig(american_to_prob(odds), method=method, tol=tol, max_iter=max_iter, padded=padded)
@@ -0,0 +1,190 @@
+# MLB Betting Model v3.1 — Partitioned Feature Store
+# ------------------------------------------------------
+# Derived game features (delta_xfip, delta_kbb, delta_wrc, delta_park, …)
+# are written once, keyed by game_id, into one directory per game date:
+#
+#   <root>/date=2024-04-01/game_id.npy
+#                          delta_xfip.npy
+#                          …
+#                          _meta.json      rows + column dtypes
+#
+# One .npy file per column, so a reader opens only the columns it asks
+# for, and one directory per day, so a backtest over a date range never
+# touches the other partitions. Readers take rows and dtypes from
+# _meta.json and skip NumPy's per-file header parsing, which dominates
+# for small daily files. Large column files are memory-mapped. New days
+# are appended by writing new partitions; a batch for a day already
+# stored is merged into it by game_id. Rewriting a day replaces its
+# partition atomically: it is built in a temp directory and renamed
+# into place. Only NumPy is needed; pandas is imported only by
+# `read_frame`.
+# ------------------------------------------------------
+
+import json
+import os
+import shutil
+import struct
+import tempfile
+
+import numpy as np
+
+KEY = "game_id"
+PREFIX = "date="
+META = "_meta.json"
+MMAP_MIN_BYTES = 1 << 20
+
+
+def _day(date):
+    """ISO day string (YYYY-MM-DD) for a str / date / datetime / datetime64."""
+    return str(np.datetime64(date, "D"))
+
+
+def _read_column(path, dtype, rows, mmap):
+    # .npy = magic (6) + version (2) + header length (2 or 4) + header + data
+    with open(path, "rb") as f:
+        prefix = f.read(12)
+        if prefix[:6] != b"\x93NUMPY":
+            raise ValueError(f"{path} is not a .npy file")
+        if prefix[6] == 1:
+            offset = 10 + struct.unpack_from("<H", prefix, 8)[0]
+        else:
+            offset = 12 + struct.unpack_from("<I", prefix, 8)[0]
+        if mmap is True or (mmap is None and rows * dtype.itemsize >= MMAP_MIN_BYTES):
+            return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(rows,))
+        f.seek(offset)
+        return np.fromfile(f, dtype=dtype, count=rows)
+
+
+class FeatureStore:
+    def __init__(self, root):
+        self.root = root
+
+    def __repr__(self):
+        return f"FeatureStore({self.root!r}, partitions={len(self.partitions())})"
+
+    def _dir(self, day):
+        return os.path.join(self.root, PREFIX + _day(day))
+
+    # =====================================================
+    # Writing
+    # =====================================================
+
+    def write_partition(self, date, columns):
+        """Write (or replace) one day: `columns` maps name → array and must include game_id."""
+        if KEY not in columns:
+            raise KeyError(f"a partition needs a {KEY!r} column")
+        arrays = {name: np.ascontiguousarray(np.asarray(values)) for name, values in columns.items()}
+        rows = {len(a) for a in arrays.values()}
+        if len(rows) != 1:
+            raise ValueError(f"columns have different lengths: {sorted(rows)}")
+
+        os.makedirs(self.root, exist_ok=True)
+        tmp = tempfile.mkdtemp(dir=self.root, prefix=".tmp-")
+        for name, a in arrays.items():
+            np.save(os.path.join(tmp, f"{name}.npy"), a, allow_pickle=False)
+        with open(os.path.join(tmp, META), "w") as f:
+            json.dump({"rows": rows.pop(), "columns": {name: a.dtype.str for name, a in arrays.items()}}, f)
+
+        final = self._dir(date)
+        if os.path.exists(final):
+            old = tempfile.mkdtemp(dir=self.root, prefix=".old-")
+            os.replace(final, os.path.join(old, "partition"))
+            os.replace(tmp, final)
+            shutil.rmtree(old)
+        else:
+            os.replace(tmp, final)
+        return final
+
+    def _merge(self, day, batch):
+        # the batch's rows replace stored rows with the same game_id; the
+        # day's other stored rows are kept, ahead of the batch
+        if not os.path.isdir(self._dir(day)):
+            return batch
+        stored = self.read(None, day, day, mmap=False)
+        if set(stored) != set(batch):
+            raise ValueError(f"partition {_day(day)} has columns {sorted(stored)}, the batch {sorted(batch)}; "
+                             f"rewrite the day with write_partition")
+        keep = ~np.isin(stored[KEY], batch[KEY])
+        return {name: np.concatenate([stored[name][keep], values]) for name, values in batch.items()}
+
+    def append(self, frame, columns, date_column="date"):
+        """
+        Write every day present in `frame` as its own partition.
+
+        `frame` is a DataFrame (or column mapping) with game_id, `date_column`
+        and `columns`; returns the days written. A day already stored is
+        merged by game_id: the frame's rows replace stored rows with the same
+        game_id and the rest are kept. Its stored columns must be exactly
+        game_id and `columns`.
+        """
+        dates = np.asarray(frame[date_column]).astype("datetime64[D]")
+        data = {name: np.asarray(frame[name]) for name in [KEY, *columns]}
+        order = np.argsort(dates, kind="stable")
+        days, starts = np.unique(dates[order], return_index=True)
+        bounds = np.append(starts, len(order))
+        for day, lo, hi in zip(days, bounds[:-1], bounds[1:]):
+            rows = order[lo:hi]
+            self.write_partition(day, self._merge(day, {name: values[rows] for name, values in data.items()}))
+        return [str(day) for day in days]
+
+    # =====================================================
+    # Reading
+    # =====================================================
+
+    def partitions(self, start=None, end=None):
+        """Days stored, sorted, optionally limited to start ≤ day ≤ end."""
+        if not os.path.isdir(self.root):
+            return []
+        days = sorted(name[len(PREFIX):] for name in os.listdir(self.root) if name.startswith(PREFIX))
+        lo = _day(start) if start is not None else None
+        hi = _day(end) if end is not None else None
+        return [d for d in days if (lo is None or d >= lo) and (hi is None or d <= hi)]
+
+    def columns(self, day):
+        with open(os.path.join(self._dir(day), META)) as f:
+            return json.load(f)["columns"]
+
+    def read(self, columns=None, start=None, end=None, mmap=None):
+        """
+        game_id plus the requested columns for every partition in [start, end].
+
+        Only the requested columns' files are opened. `mmap` None maps
+        column files of 1 MiB or more and reads smaller ones; True / False
+        force either. A single partition is returned without a copy.
+        `columns=None` reads every column of the first partition. "date"
+        is available as a datetime64[D] column.
+        """
+        days = self.partitions(start, end)
+        if columns is None:
+            columns = [c for c in (self.columns(days[0]) if days else {}) if c != KEY]
+        stored = [c for c in columns if c != "date"]
+        parts = {name: [] for name in [KEY, *stored]}
+        lengths = []
+        for day in days:
+            directory = self._dir(day)
+            with open(os.path.join(directory, META)) as f:
+                meta = json.load(f)
+            for name in parts:
+                if name not in meta["columns"]:
+                    raise KeyError(f"partition {day} has no column {name!r}")
+                parts[name].append(_read_column(os.path.join(directory, f"{name}.npy"),
+                                                np.dtype(meta["columns"][name]), meta["rows"], mmap))
+            lengths.append(meta["rows"])
+
+        out = {}
+        for name, chunks in parts.items():
+            if len(chunks) == 1:
+                out[name] = chunks[0]
+            elif chunks:
+                out[name] = np.concatenate(chunks)
+            else:
+                out[name] = np.empty(0)
+        if "date" in columns:
+            out["date"] = np.repeat(np.array(days, dtype="datetime64[D]"), lengths)
+        return out
+
+    def read_frame(self, columns=None, start=None, end=None):
+        """`read` as a DataFrame with game_id first."""
+        import pandas as pd
+
+        return pd.DataFrame(self.read(columns, start, end))
@@ -0,0 +1,70 @@
+# MLB Betting Model v3.1 — EV & Kelly Engine
+# ------------------------------------------------------
+# Scores an entire slate (or a multi-season backtest) in one vectorized
+# pass:
+#
+#   b      = decimal odds − 1            (+150 → 1.50, −120 → 0.833)
+#   EV     = p × b − (1 − p)             expected profit per $1
+#   f*     = EV / b                      full Kelly fraction, floored at 0
+#   stake  = multiplier × f*             ½-Kelly by default in the demo
+#
+# Stakes can be capped per bet (`max_stake`) and bets whose EV is below
+# `min_edge` are zeroed. `dtype=np.float32` runs the whole pass at half the
+# memory for large simulations. `kelly_fraction` is the scalar reference
+# kept for single bets and for benchmarking.
+# ------------------------------------------------------
+
+from collections import namedtuple
+
+import numpy as np
+
+from .odds import american_to_decimal
+from .precision import resolve_dtype
+
+KellyResult = namedtuple("KellyResult", ["ev", "kelly", "stake"])
+
+
+def kelly_fraction(p, odds):
+    """Full Kelly fraction and edge for one bet at American `odds`."""
+    b = (odds / 100) if odds > 0 else (100 / -odds)
+    q = 1 - p
+    edge = b * p - q
+    f_star = max(0.0, edge / b) if b > 0 else 0.0
+    return f_star, edge
+
+
+def ev_kelly(p, odds, odds_format="american", kelly_multiplier=1.0, max_stake=None, min_edge=0.0,
+             dtype=None):
+    """
+    EV per $, full Kelly fraction and recommended stake for every bet.
+
+    `p` and `odds` are broadcastable arrays; `odds_format` is "american" or
+    "decimal". Returns a `KellyResult` of `dtype` (default float64) arrays.
+    """
+    dtype = resolve_dtype(dtype)
+    p = np.asarray(p, dtype=dtype)
+    odds = np.asarray(odds)
+    scalar = p.ndim == 0 and odds.ndim == 0
+    p, odds = np.atleast_1d(p), np.atleast_1d(odds)
+    if odds_format == "american":
+        b = american_to_decimal(odds, out=np.empty(odds.shape, dtype=dtype))
+    elif odds_format == "decimal":
+        b = odds.astype(dtype)
+    else:
+        raise ValueError(f"unknown odds format {odds_format!r}; expected 'american' or 'decimal'")
+    b -= 1.0
+
+    ev = p * b
+    ev -= 1.0 - p
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        kelly = np.divide(ev, b, out=np.zeros_like(ev), where=b > 0)
+    np.maximum(kelly, 0.0, out=kelly)
+
+    stake = np.multiply(kelly, kelly_multiplier, dtype=dtype)
+    if max_stake is not None:
+        np.minimum(stake, max_stake, out=stake)
+    stake[~(ev >= min_edge)] = 0.0
+    if scalar:
+        return KellyResult(float(ev[0]), float(kelly[0]), float(stake[0]))
+    return KellyResult(ev, kelly, stake)
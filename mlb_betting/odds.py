@@ -0,0 +1,171 @@
+# MLB Betting Model v3.1 — Vectorized Odds Conversion
+# ------------------------------------------------------
+# Converts whole arrays of quotes between the four odds formats used
+# across the model:
+#   • American   (-130, +110)
+#   • Decimal    (1.769, 2.10)
+#   • Fractional (10/13, 11/10) as separate numerator / denominator arrays
+#   • Implied probability (0.565, 0.476)
+#
+# Every function accepts scalars, lists, NumPy arrays or pandas Series and
+# works in a single vectorized pass, so a multi-season line history can be
+# converted without a Python call per quote. Scalars in → float out.
+#
+# Conversions that produce float64 results accept an optional `out=` array
+# so large backtests can reuse one buffer instead of allocating per call.
+# ------------------------------------------------------
+
+import numpy as np
+
+
+def _as_float(x):
+    return np.asarray(x, dtype=np.float64)
+
+
+def _finish(result, scalar_input):
+    return float(result) if scalar_input else result
+
+
+def _prepare_out(a, out):
+    if out is None:
+        return np.empty(a.shape, dtype=np.float64)
+    return out
+
+
+# =====================================================
+# American ↔ probability / decimal
+# =====================================================
+
+def american_to_prob(odds, out=None):
+    """Implied win probability of American odds (vig included)."""
+    a = np.asarray(odds)
+    scalar = a.ndim == 0
+    out = _prepare_out(a, out)
+    # favourites: |a| / (|a| + 100)   underdogs: 100 / (a + 100)
+    np.abs(a, out=out, casting="unsafe")
+    denom = out + 100.0
+    np.copyto(out, 100.0, where=a > 0)
+    np.divide(out, denom, out=out)
+    return _finish(out, scalar)
+
+
+def american_to_decimal(odds, out=None):
+    """Decimal (European) odds, stake included: +150 → 2.50, -120 → 1.833."""
+    a = np.asarray(odds)
+    scalar = a.ndim == 0
+    out = _prepare_out(a, out)
+    # profit per $1 staked: a / 100 for underdogs, 100 / |a| for favourites
+    np.abs(a, out=out, casting="unsafe")
+    np.divide(100.0, out, out=out, where=a < 0)
+    np.divide(out, 100.0, out=out, where=a > 0)
+    out += 1.0
+    return _finish(out, scalar)
+
+
+def prob_to_american(prob):
+    """Fair American odds for a win probability (no rounding applied)."""
+    p = _as_float(prob)
+    scalar = p.ndim == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.where(p >= 0.5, -100.0 * p / (1.0 - p), 100.0 * (1.0 - p) / p)
+    return _finish(result, scalar)
+
+
+def decimal_to_american(decimal):
+    """American odds for decimal odds: 2.50 → +150, 1.833 → -120."""
+    d = _as_float(decimal)
+    scalar = d.ndim == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.where(d >= 2.0, 100.0 * (d - 1.0), -100.0 / (d - 1.0))
+    return _finish(result, scalar)
+
+
+# =====================================================
+# Decimal ↔ probability
+# =====================================================
+
+def decimal_to_prob(decimal, out=None):
+    d = np.asarray(decimal)
+    scalar = d.ndim == 0
+    out = _prepare_out(d, out)
+    np.divide(1.0, d, out=out, casting="unsafe")
+    return _finish(out, scalar)
+
+
+def prob_to_decimal(prob, out=None):
+    p = np.asarray(prob)
+    scalar = p.ndim == 0
+    out = _prepare_out(p, out)
+    with np.errstate(divide="ignore"):
+        np.divide(1.0, p, out=out, casting="unsafe")
+    return _finish(out, scalar)
+
+
+# =====================================================
+# Fractional (numerator / denominator arrays)
+# =====================================================
+
+def fractional_to_decimal(numerator, denominator):
+    """Decimal odds for fractional odds given as numerator / denominator."""
+    num = _as_float(numerator)
+    den = _as_float(denominator)
+    scalar = num.ndim == 0 and den.ndim == 0
+    return _finish(1.0 + num / den, scalar)
+
+
+def decimal_to_fractional(decimal, max_denominator=100):
+    """
+    Fractional odds for decimal odds as integer (numerator, denominator) arrays.
+
+    Uses the continued-fraction expansion of (decimal - 1) evaluated for
+    all quotes at once; the loop runs over expansion terms, never over
+    quotes. Each result is the last convergent whose denominator does not
+    exceed `max_denominator` (e.g. 1.769 → 10/13).
+    """
+    x = _as_float(decimal) - 1.0
+    scalar = x.ndim == 0
+    x = np.atleast_1d(x)
+
+    h_prev, h = np.zeros_like(x), np.ones_like(x)
+    k_prev, k = np.ones_like(x), np.zeros_like(x)
+    rest = x.copy()
+    done = ~np.isfinite(x) | (x < 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(32):
+            a = np.floor(rest)
+            h_next = a * h + h_prev
+            k_next = a * k + k_prev
+            take = ~done & (k_next <= max_denominator)
+            h_prev, h = np.where(take, h, h_prev), np.where(take, h_next, h)
+            k_prev, k = np.where(take, k, k_prev), np.where(take, k_next, k)
+            frac = rest - a
+            done |= ~take | (frac < 1e-9)
+            if done.all():
+                break
+            rest = np.where(done, 1.0, 1.0 / frac)
+
+    num = h.astype(np.int64)
+    den = k.astype(np.int64)
+    if scalar:
+        return int(num[0]), int(den[0])
+    return num, den
+
+
+def fractional_to_prob(numerator, denominator):
+    num = _as_float(numerator)
+    den = _as_float(denominator)
+    scalar = num.ndim == 0 and den.ndim == 0
+    return _finish(den / (num + den), scalar)
+
+
+def prob_to_fractional(prob, max_denominator=100):
+    return decimal_to_fractional(1.0 / _as_float(prob), max_denominator)
+
+
+def american_to_fractional(odds, max_denominator=100):
+    return decimal_to_fractional(american_to_decimal(odds), max_denominator)
+
+
+def fractional_to_american(numerator, denominator):
+    return decimal_to_american(fractional_to_decimal(numerator, denominator))
@@ -0,0 +1,97 @@
+# MLB Betting Model v3.1 — Out-of-Fold Predictions
+# ------------------------------------------------------
+# Fits the base logistic model and the isotonic calibrator on k − 1 folds
+# and scores the held-out fold, for every fold. The result is one honest
+# (never-seen-in-training) p_base / p_calibrated per game, which is what
+# the blend weight α has to be tuned on.
+#
+# Folds are independent, so `n_jobs > 1` fits them in a process pool.
+# X, y and the fold ids are shipped to each worker once (pool initializer)
+# rather than once per fold, and every worker sends back only its fold's
+# predictions, so wall time falls roughly linearly with cores up to
+# n_splits on multi-season data.
+# ------------------------------------------------------
+
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from sklearn.isotonic import IsotonicRegression
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import StratifiedKFold
+
+from .calibration import export_isotonic
+
+OOFPredictions = namedtuple("OOFPredictions", ["p_base", "p_calibrated", "fold"])
+
+
+def fold_ids(y, n_splits=5, seed=42):
+    """Stratified fold number (0 … n_splits − 1) for every row."""
+    y = np.asarray(y)
+    folds = np.empty(len(y), dtype=np.int64)
+    splitter = StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=seed)
+    for k, (_, test_idx) in enumerate(splitter.split(np.zeros(len(y)), y)):
+        folds[test_idx] = k
+    return folds
+
+
+def _fit_fold(X, y, train):
+    base_model = LogisticRegression()
+    base_model.fit(X[train], y[train])
+    calibrator = IsotonicRegression(out_of_bounds="clip")
+    calibrator.fit(base_model.predict_proba(X[train])[:, 1], y[train])
+    return base_model, export_isotonic(calibrator)
+
+
+def _predict_fold(X, y, folds, k):
+    test = folds == k
+    base_model, calibrator = _fit_fold(X, y, ~test)
+    p_base = base_model.predict_proba(X[test])[:, 1]
+    return k, p_base, calibrator.transform(p_base)
+
+
+_worker_data = None
+
+
+def _init_worker(X, y, folds):
+    global _worker_data
+    _worker_data = (X, y, folds)
+
+
+def _predict_fold_in_worker(k):
+    return _predict_fold(*_worker_data, k)
+
+
+def out_of_fold(X, y, n_splits=5, seed=42, n_jobs=1):
+    """
+    Out-of-fold p_base / p_calibrated for every row.
+
+    n_jobs: worker processes for the per-fold fits (-1 = all cores);
+            1 fits the folds serially in this process.
+    """
+    X = np.asarray(X)
+    if X.dtype != np.float32:
+        # float32 design matrices (see precision.py) are fitted as they are
+        X = X.astype(np.float64, copy=False)
+    y = np.asarray(y)
+    folds = fold_ids(y, n_splits, seed)
+    if n_jobs is not None and n_jobs < 0:
+        n_jobs = os.cpu_count() or 1
+    n_jobs = min(n_jobs or 1, n_splits)
+
+    if n_jobs == 1:
+        results = (_predict_fold(X, y, folds, k) for k in range(n_splits))
+    else:
+        pool = ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker,
+                                   initargs=(X, y, folds))
+        with pool:
+            results = list(pool.map(_predict_fold_in_worker, range(n_splits)))
+
+    p_base = np.empty(len(y))
+    p_calibrated = np.empty(len(y))
+    for k, base, calibrated in results:
+        test = folds == k
+        p_base[test] = base
+        p_calibrated[test] = calibrated
+    return OOFPredictions(p_base, p_calibrated, folds)
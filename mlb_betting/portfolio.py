@@ -0,0 +1,260 @@
+# MLB Betting Model v3.1 — Simultaneous Kelly Optimizer
+# ------------------------------------------------------
+# `kelly_fraction` sizes each bet as if it were the only one on the board.
+# With a full slate of concurrent bets that badly over-commits the
+# bankroll. This module sizes every open position jointly by maximising
+# expected log growth:
+#
+#   max_f  E[ log(1 + Σ_j f_j R_j) ]
+#   s.t.   f_j ≥ 0,  f_j ≤ max_stake,  Σ_j f_j ≤ max_total
+#
+# where R_j is +b_j if bet j wins and −1 if it loses. Bets sharing a
+# `group` (e.g. ML, F5 ML and run line on the same team) share one
+# uniform draw and therefore win or lose together; different groups are
+# independent.
+#
+# A group of m bets has only m + 1 distinct outcomes (its draw falls
+# between two of the sorted win probabilities), so while the product of
+# those counts stays within `max_exact_scenarios` (2^16, e.g. a 15-game
+# slate of single bets) the expectation is enumerated exactly and the
+# stakes depend on nothing but the inputs. Larger slates fall back to a
+# fixed set of simulated scenarios (common random numbers, so repeated
+# solves are deterministic) plus the exact "every bet loses" scenario at
+# its true probability, so the optimizer can never stake the whole
+# bankroll. Sampling breaks the symmetry between identical bets, so the
+# simulated solution is averaged over each set of interchangeable bets
+# (same p and odds, in groups with the same bets), which keeps it
+# feasible and gives identical bets identical stakes.
+#
+# The solver is a projected Newton method with backtracking. It remembers
+# the last solution per bet id and warm-starts from it, so re-solving
+# after line moves — or the next slate with overlapping bets — takes only
+# a few iterations.
+# ------------------------------------------------------
+
+from collections import namedtuple
+
+import numpy as np
+
+KellyAllocation = namedtuple("KellyAllocation", ["stakes", "growth", "iterations", "converged"])
+
+
+def _project(x, max_stake, max_total):
+    # Euclidean projection onto {0 ≤ f ≤ max_stake, Σf ≤ max_total}:
+    # f = clip(x − λ, 0, max_stake) with the smallest λ ≥ 0 that meets the
+    # budget. Σf is piecewise linear in λ with breakpoints at x and
+    # x − max_stake, so evaluate it at every breakpoint and interpolate.
+    f = np.clip(x, 0.0, max_stake)
+    if f.sum() <= max_total:
+        return f
+    knots = np.sort(np.concatenate([x, x - max_stake]))
+    totals = np.clip(x[None, :] - knots[:, None], 0.0, max_stake).sum(axis=1)
+    k = np.searchsorted(-totals, -max_total, side="right") - 1
+    span = totals[k] - totals[k + 1]
+    lam = knots[k] + (totals[k] - max_total) * (knots[k + 1] - knots[k]) / span if span > 0 else knots[k]
+    return np.clip(x - lam, 0.0, max_stake)
+
+
+def _equality_newton(H, g):
+    # maximise gᵀd − ½ dᵀHd subject to Σd = 0: returns (d, λ)
+    n = len(g)
+    kkt = np.zeros((n + 1, n + 1))
+    kkt[:n, :n] = H
+    kkt[:n, n] = kkt[n, :n] = 1.0
+    solution = np.linalg.solve(kkt, np.append(g, 0.0))
+    return solution[:n], solution[n]
+
+
+class SimultaneousKelly:
+    def __init__(self, max_total=1.0, max_stake=1.0, kelly_multiplier=1.0, n_scenarios=2000,
+                 seed=42, max_iter=100, tol=1e-10, max_exact_scenarios=1 << 16):
+        self.max_total = max_total
+        self.max_stake = max_stake
+        self.kelly_multiplier = kelly_multiplier
+        self.n_scenarios = n_scenarios
+        self.seed = seed
+        self.max_iter = max_iter
+        self.tol = tol
+        self.max_exact_scenarios = max_exact_scenarios
+        self._last = {}
+
+    @staticmethod
+    def _exact_scenarios(p, b, group_idx, n_groups):
+        # every joint outcome: product over groups of each group's m + 1
+        # outcomes (u in [t_(i−1), t_i) over its sorted probabilities, where
+        # the bets with p ≥ t_i win), dropping outcomes of probability 0
+        R = np.zeros((1, p.size))
+        weights = np.ones(1)
+        for g in range(n_groups):
+            members = np.flatnonzero(group_idx == g)
+            edges = np.concatenate([[0.0], np.sort(p[members]), [1.0]])
+            probs = np.diff(edges)
+            keep = probs > 0.0
+            wins = p[members][None, :] >= edges[1:][:, None]
+            patterns = np.where(wins, b[members], -1.0)[keep]
+            R = np.repeat(R, len(patterns), axis=0)
+            R[:, members] = np.tile(patterns, (len(weights), 1))
+            weights = np.outer(weights, probs[keep]).ravel()
+        return R, weights
+
+    def _scenarios(self, p, b, groups):
+        _, group_idx = np.unique(groups, return_inverse=True)
+        n_groups = group_idx.max() + 1
+        outcomes = np.bincount(group_idx) + 1
+        if np.prod(outcomes.astype(np.float64)) <= self.max_exact_scenarios:
+            return self._exact_scenarios(p, b, group_idx, n_groups) + (True,)
+        rng = np.random.default_rng(self.seed)
+        u = rng.random((self.n_scenarios, n_groups))
+        R = np.where(u[:, group_idx] < p, b, -1.0)
+
+        # replace the sampled "every bet loses" draws by one exact scenario;
+        # a group loses outright when its draw misses even its likeliest bet
+        best_p = np.zeros(n_groups)
+        np.maximum.at(best_p, group_idx, p)
+        p_all_lose = np.prod(1.0 - best_p)
+        R = R[(R > 0.0).any(axis=1)]
+        weights = np.full(len(R) + 1, (1.0 - p_all_lose) / max(len(R), 1))
+        weights[-1] = p_all_lose
+        return np.vstack([R, np.full(p.size, -1.0)]), weights, False
+
+    @staticmethod
+    def _symmetrize(f, p, b, groups):
+        # average f over interchangeable bets: same (p, b) in groups holding
+        # the same multiset of (p, b)
+        signature = {}
+        for g, pj, bj in zip(groups.tolist(), p.tolist(), b.tolist()):
+            signature.setdefault(g, []).append((pj, bj))
+        signature = {g: tuple(sorted(bets)) for g, bets in signature.items()}
+        classes = {}
+        labels = np.array([classes.setdefault((signature[g], pj, bj), len(classes))
+                           for g, pj, bj in zip(groups.tolist(), p.tolist(), b.tolist())])
+        return (np.bincount(labels, weights=f) / np.bincount(labels))[labels]
+
+    @staticmethod
+    def _growth(R, weights, f):
+        wealth = 1.0 + R @ f
+        if wealth.min() <= 0.0:
+            return -np.inf, wealth
+        return weights @ np.log(wealth), wealth
+
+    def _stationary(self, f, grad):
+        return np.abs(_project(f + grad, self.max_stake, self.max_total) - f).max() < self.tol
+
+    def _newton_direction(self, f, grad, hess):
+        # Newton step on the variables not held at a bound. On the budget
+        # face (Σf = max_total) a bound only holds a variable if its gradient
+        # is beyond the budget's multiplier λ, and a step that would raise
+        # Σf is replaced by the Newton step within the face (Σ d = 0):
+        #   [H 1; 1ᵀ 0] [d; λ] = [g; 0]
+        at_lo = f <= 0.0
+        at_hi = f >= self.max_stake
+        on_budget = f.sum() >= self.max_total - 1e-12
+        lam = 0.0
+        inner = ~at_lo & ~at_hi
+        if on_budget and inner.any():
+            try:
+                lam = _equality_newton(hess[np.ix_(inner, inner)], grad[inner])[1]
+            except np.linalg.LinAlgError:
+                lam = grad[inner].mean()
+        free = ~((at_lo & (grad <= lam)) | (at_hi & (grad >= lam)))
+        direction = np.zeros_like(f)
+        if not free.any():
+            return direction
+        H, g = hess[np.ix_(free, free)], grad[free]
+        try:
+            d = np.linalg.solve(H, g)
+            if on_budget and d.sum() > 0.0:
+                d = _equality_newton(H, g)[0]
+        except np.linalg.LinAlgError:
+            d = g
+        direction[free] = d
+        return direction
+
+    def _line_search(self, R, weights, f, growth, wealth, grad, direction):
+        # backtracking along the projection arc; (f, growth, wealth) or None.
+        # A step may cut the worst scenario's wealth to no less than 1/100
+        # of what it was: with max_total = 1 the projection lands on Σf = 1,
+        # where the all-lose scenario is ruined to rounding and the Hessian
+        # is too ill-conditioned to step back out
+        floor = 0.01 * wealth.min()
+        step = 1.0
+        while step > 1e-12:
+            candidate = _project(f + step * direction, self.max_stake, self.max_total)
+            new_growth, new_wealth = self._growth(R, weights, candidate)
+            if (new_growth >= growth + 1e-4 * grad @ (candidate - f) and new_wealth.min() >= floor
+                    and np.any(candidate != f)):
+                return candidate, new_growth, new_wealth
+            step *= 0.5
+        return None
+
+    def solve(self, p, decimal_odds, groups=None, bet_ids=None, warm_start=None):
+        """
+        Jointly optimal Kelly stakes for concurrent bets.
+
+        `p` and `decimal_odds` are per-bet arrays. `bet_ids` (hashable per
+        bet) enable warm-starting from the previous solve; an explicit
+        `warm_start` array takes precedence.
+        """
+        p = np.asarray(p, dtype=np.float64)
+        b = np.asarray(decimal_odds, dtype=np.float64) - 1.0
+        n = p.size
+        groups = np.arange(n) if groups is None else np.asarray(groups)
+        stakes = np.zeros(n)
+
+        # bets without an edge get nothing (scenarios are never negatively
+        # correlated, so they cannot hedge), which keeps the problem small
+        live = p * b - (1.0 - p) > 0.0
+        if not live.any():
+            return KellyAllocation(stakes, 0.0, 0, True)
+
+        live_ids = None
+        if bet_ids is not None:
+            bet_ids = list(bet_ids)
+            live_ids = [bet_ids[i] for i in np.flatnonzero(live)]
+
+        if warm_start is not None:
+            f = np.asarray(warm_start, dtype=np.float64)[live]
+        elif live_ids is not None:
+            f = np.array([self._last.get(k, 0.0) for k in live_ids])
+        else:
+            f = np.zeros(live.sum())
+        f = _project(f, self.max_stake, self.max_total)
+
+        R, weights, exact = self._scenarios(p[live], b[live], groups[live])
+        growth, wealth = self._growth(R, weights, f)
+        if not np.isfinite(growth):
+            f = np.zeros_like(f)
+            growth, wealth = self._growth(R, weights, f)
+
+        converged = False
+        it = 0
+        for it in range(1, self.max_iter + 1):
+            inv = 1.0 / wealth
+            grad = R.T @ (weights * inv)
+
+            # stop when the projected gradient step no longer moves f; this
+            # is the only test that reports convergence
+            if self._stationary(f, grad):
+                converged = True
+                break
+
+            Rw = R * (np.sqrt(weights) * inv)[:, None]
+            hess = Rw.T @ Rw
+            step = self._line_search(R, weights, f, growth, wealth, grad, self._newton_direction(f, grad, hess))
+            if step is None:
+                # Newton failed to ascend: projected-gradient arc instead,
+                # which always ascends for a small enough step
+                step = self._line_search(R, weights, f, growth, wealth, grad, grad / np.trace(hess))
+            if step is None:
+                break
+            f, growth, wealth = step
+        else:
+            converged = self._stationary(f, R.T @ (weights / wealth))
+
+        if not exact:
+            f = self._symmetrize(f, p[live], b[live], groups[live])
+            growth, wealth = self._growth(R, weights, f)
+        stakes[live] = f * self.kelly_multiplier
+        if live_ids is not None:
+            self._last = dict(zip(live_ids, f.tolist()))
+        return KellyAllocation(stakes, float(growth), it, converged)
@@ -0,0 +1,26 @@
+# MLB Betting Model v3.1 — Numeric Precision
+# ------------------------------------------------------
+# Everything is float64 by default. Multi-season Monte Carlo runs hold
+# hundreds of millions of probabilities, so the features, probabilities,
+# EV and Kelly paths also run in float32, at half the memory. Model
+# fitting stays in float64 and only the per-game arrays change width.
+# benchmarks/bench_precision.py checks that the two modes agree within
+# stated tolerances.
+#
+# Functions with a `dtype=` argument work in that precision. When it is
+# left out they follow the `out=` buffer if one is given, else float64.
+# ------------------------------------------------------
+
+import numpy as np
+
+PRECISIONS = ("float64", "float32")
+
+
+def resolve_dtype(dtype=None, out=None):
+    """Working dtype: explicit `dtype`, else that of `out`, else float64."""
+    if dtype is None:
+        dtype = out.dtype if out is not None else np.float64
+    dtype = np.dtype(dtype)
+    if dtype.name not in PRECISIONS:
+        raise ValueError(f"unsupported precision {dtype.name!r}; expected one of {PRECISIONS}")
+    return dtype
@@ -0,0 +1,171 @@
+# MLB Betting Model v3.1 — Rolling Stat Engine
+# ------------------------------------------------------
+# Pre-game xFIP, K-BB% and wRC+ are rolling values ("last 5 starts",
+# "last 14 days") per pitcher and per team. Each is a ratio of summed
+# counting stats, e.g. K-BB% = Σ(K − BB) / ΣBF over the window, never a
+# mean of per-game ratios.
+#
+# `rolling_sum` computes the window sums for every row of a season's
+# game log at once:
+#   1. stable sort by (group, time)
+#   2. one cumulative sum per component column, so C[i] = Σ rows < i
+#   3. each row's window is an index range [lo, hi) in its own group
+#      (hi = the row itself, so only earlier games count, with no leakage
+#      from the game being predicted), and its sum is C[hi] − C[lo]
+# That is one linear pass plus the sort. Windows are counted in games
+# (`times=None`) or in days (`times=` game dates, window = [t − N, t)).
+#
+# `RollingState` keeps the same windows live: each group holds a ring
+# buffer (game windows) or a deque (day windows) plus a running total, so
+# recording a finished game or reading a window is O(1) amortised. Ring
+# totals are re-summed once per wrap to bound floating-point drift.
+# ------------------------------------------------------
+
+from collections import deque
+
+import numpy as np
+
+PITCHER_COMPONENTS = ("ip", "bf", "k", "bb", "hbp", "fb")
+TEAM_COMPONENTS = ("pa", "wrc_plus_pa")
+
+
+def _as_days(times):
+    times = np.asarray(times)
+    if np.issubdtype(times.dtype, np.datetime64):
+        return times.astype("datetime64[D]").astype(np.int64)
+    return times.astype(np.int64)
+
+
+def rolling_sum(values, groups, window, times=None):
+    """
+    Window sums of `values` over each row's earlier games in the same group.
+
+    values: (n,) or (n, k) counting stats, rows in chronological order
+            within each group (only needed when `times` is None)
+    groups: (n,) pitcher / team ids
+    window: games (times=None) or days (window covers [t − window, t))
+    times:  (n,) game dates (datetime64 or integer days) for day windows
+
+    Returns (sums, counts) in the input row order; sums has the shape of
+    `values` and counts is the number of games in each window.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    groups = np.asarray(groups)
+    n = len(groups)
+    _, codes = np.unique(groups, return_inverse=True)
+    if times is None:
+        order = np.argsort(codes, kind="stable")
+        idx = np.arange(n)
+        first = np.empty(n, dtype=bool)
+        first[:1] = True
+        np.not_equal(codes[order][1:], codes[order][:-1], out=first[1:])
+        start = np.maximum.accumulate(np.where(first, idx, 0))
+        hi = idx
+        lo = np.maximum(hi - window, start)
+    else:
+        days = _as_days(times)
+        order = np.lexsort((days, codes))
+        # space the groups further apart than any window, so one sorted
+        # key array serves every group's searches
+        span = int(days.max() - days.min()) + int(window) + 1 if n else 1
+        key = codes[order].astype(np.int64) * span + (days[order] - (days.min() if n else 0))
+        lo = np.searchsorted(key, key - window, side="left")
+        hi = np.searchsorted(key, key, side="left")
+
+    flat = values.ndim == 1
+    v = values[order].reshape(n, -1)
+    cumulative = np.zeros((n + 1, v.shape[1]))
+    np.cumsum(v, axis=0, out=cumulative[1:])
+
+    sums = np.empty_like(v)
+    sums[order] = cumulative[hi] - cumulative[lo]
+    counts = np.empty(n, dtype=np.int64)
+    counts[order] = hi - lo
+    return (sums[:, 0] if flat else sums), counts
+
+
+class RollingState:
+    """Live rolling sums per group with O(1) updates."""
+
+    def __init__(self, n_components, window, by="games"):
+        if by not in ("games", "days"):
+            raise ValueError(f"unknown window unit {by!r}; expected 'games' or 'days'")
+        self.n_components = n_components
+        self.window = int(window)
+        self.by = by
+        self._groups = {}
+
+    def __len__(self):
+        return len(self._groups)
+
+    def _state(self, group):
+        state = self._groups.get(group)
+        if state is None:
+            if self.by == "games":
+                state = [np.zeros((self.window, self.n_components)), 0, 0, np.zeros(self.n_components)]
+            else:
+                state = [deque(), np.zeros(self.n_components)]
+            self._groups[group] = state
+        return state
+
+    def _evict(self, state, day):
+        games, total = state
+        while games and games[0][0] < day - self.window:
+            total -= games.popleft()[1]
+
+    def update(self, group, values, time=None):
+        """Record a finished game for `group` (game date `time` for day windows)."""
+        values = np.asarray(values, dtype=np.float64)
+        state = self._state(group)
+        if self.by == "games":
+            ring, pos, count, total = state
+            total -= ring[pos]
+            ring[pos] = values
+            total += values
+            state[1] = pos = (pos + 1) % self.window
+            state[2] = min(count + 1, self.window)
+            if pos == 0:
+                np.sum(ring, axis=0, out=total)
+        else:
+            day = int(_as_days(time))
+            state[0].append((day, values))
+            state[1] += values
+            self._evict(state, day)
+
+    def sums(self, group, time=None):
+        """(sums, count) of `group`'s window before its next game (dated `time` for day windows)."""
+        state = self._state(group)
+        if self.by == "games":
+            return state[3].copy(), state[2]
+        self._evict(state, int(_as_days(time)))
+        return state[1].copy(), len(state[0])
+
+
+# =====================================================
+# Derived rates
+# =====================================================
+
+def _columns(sums, names):
+    sums = np.asarray(sums, dtype=np.float64)
+    return dict(zip(names, np.moveaxis(sums, -1, 0)))
+
+
+def xfip(sums, lg_hr_per_fb=0.105, fip_constant=3.10):
+    """xFIP from summed PITCHER_COMPONENTS; NaN for an empty window."""
+    c = _columns(sums, PITCHER_COMPONENTS)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (13.0 * c["fb"] * lg_hr_per_fb + 3.0 * (c["bb"] + c["hbp"]) - 2.0 * c["k"]) / c["ip"] + fip_constant
+
+
+def k_bb_pct(sums):
+    """K-BB% (strikeouts minus walks per batter faced, in percent)."""
+    c = _columns(sums, PITCHER_COMPONENTS)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 100.0 * (c["k"] - c["bb"]) / c["bf"]
+
+
+def wrc_plus(sums):
+    """PA-weighted wRC+ from summed TEAM_COMPONENTS (pa, wRC+ × pa)."""
+    c = _columns(sums, TEAM_COMPONENTS)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return c["wrc_plus_pa"] / c["pa"]
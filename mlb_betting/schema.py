@@ -0,0 +1,106 @@
+# MLB Betting Model v3.1 — Compact Frame Schemas
+# ------------------------------------------------------
+# pandas defaults to object strings, int64 and float64. A season-scale
+# history needs far less:
+#   • text with a handful of distinct values (Game, Bet_Type, Risk_Level,
+#     Recommendation, …) → categorical (one small int code per row)
+#   • American odds (|odds| < 32768) → int16, except best_odds, which is
+#     NaN for a game no book quotes and so follows the float dtype
+#   • outcomes, months → int8; game ids → int32
+#   • stats, probabilities, EV, Kelly → float32 (games frames follow the
+#     demo's `precision`)
+#
+# `apply_schema` casts a frame to one of the schemas below. It refuses
+# integer casts that would wrap or that meet a NaN. `memory_report` prints each frame's
+# size next to its size as plain object / int64 / float64, and `widen`
+# returns that plain form. Printed tables use `widen(df, decimals)` so
+# their formatting is unchanged.
+# ------------------------------------------------------
+
+import numpy as np
+import pandas as pd
+
+BET_TYPES = ["Moneyline - Away", "Moneyline - Home", "Over 7.5", "Under 7.5"]
+RISK_LEVELS = ["Low", "Moderate", "High"]
+RECOMMENDATIONS = ["✅ Bet", "🚫 Pass"]
+
+RESULTS_SCHEMA = {
+    "Game": "category",
+    "Bet_Type": pd.CategoricalDtype(BET_TYPES),
+    "Probability_%": np.float32,
+    "Odds": np.int16,
+    "EV_per_$": np.float32,
+    "Risk_Level": pd.CategoricalDtype(RISK_LEVELS, ordered=True),
+    "Recommendation": pd.CategoricalDtype(RECOMMENDATIONS),
+    "Actual_Result": np.int8,
+    "Came_True": pd.CategoricalDtype(["No", "Yes"]),
+}
+# decimals the results columns are generated with (for printing)
+RESULTS_DECIMALS = {"Probability_%": 2, "EV_per_$": 3}
+
+GAME_FLOATS = [
+    "away_sp_xfip", "home_sp_xfip", "away_sp_kbb", "home_sp_kbb",
+    "away_wrc_plus_vs_hand", "home_wrc_plus_vs_hand", "park_factor",
+    "delta_xfip", "delta_kbb", "delta_wrc", "delta_park",
+    "p_base", "p_calibrated", "p_market", "p_blended", "ev", "kelly", "stake",
+]
+
+
+def games_schema(dtype=np.float32):
+    """Schema for simulated / streamed game frames; float columns use `dtype`."""
+    schema = {name: dtype for name in [*GAME_FLOATS, "best_odds"]}
+    schema.update({
+        "away_moneyline": np.int16,
+        "home_moneyline": np.int16,
+        "actual_outcome": np.int8,
+        "month": np.int8,
+        "game_id": np.int32,
+    })
+    return schema
+
+
+def apply_schema(df, schema):
+    """Cast the columns of `df` present in `schema` (in place) and return it."""
+    for name, dtype in schema.items():
+        if name not in df.columns:
+            continue
+        target = pd.api.types.pandas_dtype(dtype)
+        if target.kind in "iu" and len(df):
+            if df[name].isna().any():
+                raise ValueError(f"column {name!r} has missing values, which {target.name} cannot hold")
+            info = np.iinfo(target)
+            lo, hi = df[name].min(), df[name].max()
+            if lo < info.min or hi > info.max:
+                raise ValueError(f"column {name!r} spans {lo}…{hi}, outside {target.name}")
+        df[name] = df[name].astype(target)
+    return df
+
+
+def widen(df, decimals=None):
+    """`df` with categoricals as their categories' dtype, ints as int64 and floats as float64."""
+    wide = {}
+    for name, column in df.items():
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            column = column.astype(column.cat.categories.dtype)
+        elif pd.api.types.is_bool_dtype(column):
+            pass
+        elif pd.api.types.is_integer_dtype(column):
+            column = column.astype(np.int64)
+        elif pd.api.types.is_float_dtype(column):
+            column = column.astype(np.float64)
+            if decimals and name in decimals:
+                column = column.round(decimals[name])
+        wide[name] = column
+    return pd.DataFrame(wide, index=df.index)
+
+
+def memory_report(frames):
+    """Rows, columns and deep memory of each named frame, compact vs plain dtypes."""
+    rows = []
+    for label, df in frames.items():
+        compact = df.memory_usage(index=True, deep=True).sum()
+        plain = widen(df).memory_usage(index=True, deep=True).sum()
+        rows.append({"Frame": label, "Rows": len(df), "Columns": df.shape[1],
+                     "Compact KB": compact / 1024, "Plain KB": plain / 1024,
+                     "Saved": f"{1 - compact / plain:.0%}"})
+    return pd.DataFrame(rows)
@@ -0,0 +1,72 @@
+# MLB Betting Model v3.1 — Dependency-Free Logistic Scorer
+# ------------------------------------------------------
+# A fitted LogisticRegression is just a coefficient vector, an intercept
+# and the order of the features it was trained on. `export_logistic`
+# pulls those out of the sklearn model once; `LogisticScorer` then scores
+# a slate with one matrix-vector product and a sigmoid — no sklearn input
+# validation, no DataFrame overhead — and matches sklearn's
+# `predict_proba(X)[:, 1]` to floating-point round-off.
+#
+# Scoring runs in float64 by default or float32 (`dtype=`, or the dtype
+# of `out=`) for large simulations; see precision.py.
+#
+# This module only imports NumPy, so game-day scoring processes never
+# have to import sklearn.
+# ------------------------------------------------------
+
+import numpy as np
+
+from .design import design_matrix
+from .precision import resolve_dtype
+
+
+class LogisticScorer:
+    def __init__(self, coef, intercept, features):
+        self.coef = np.ascontiguousarray(coef, dtype=np.float64).ravel()
+        self.intercept = float(np.ravel(intercept)[0])
+        self.features = tuple(str(f) for f in features)
+        if len(self.coef) != len(self.features):
+            raise ValueError(f"{len(self.coef)} coefficients for {len(self.features)} features")
+
+    def __repr__(self):
+        return f"LogisticScorer(features={list(self.features)})"
+
+    def _matrix(self, X, dtype=np.float64):
+        if hasattr(X, "columns") or isinstance(X, dict):
+            # DataFrame or column mapping: written straight into one matrix
+            # in training order (engineered deltas computed from raw columns)
+            return design_matrix(X, self.features, dtype)
+        return np.asarray(X, dtype=dtype)
+
+    def decision_function(self, X, out=None, dtype=None):
+        dtype = resolve_dtype(dtype, out)
+        z = np.dot(self._matrix(X, dtype), self.coef.astype(dtype, copy=False), out=out)
+        z += self.intercept
+        return z
+
+    def predict_proba(self, X, out=None, dtype=None):
+        """Win probability (positive class) for every row of `X`."""
+        z = self.decision_function(X, out=out, dtype=dtype)
+        # 1 / (1 + e^-z), computed in place
+        np.negative(z, out=z)
+        np.exp(z, out=z)
+        z += 1.0
+        np.reciprocal(z, out=z)
+        return z
+
+    def save(self, path):
+        np.savez(path, coef=self.coef, intercept=np.array([self.intercept]),
+                 features=np.array(self.features))
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data["coef"], data["intercept"], data["features"].tolist())
+
+
+def export_logistic(model, features):
+    """`LogisticScorer` from a fitted binary sklearn LogisticRegression."""
+    coef = np.asarray(model.coef_)
+    if coef.shape[0] != 1:
+        raise ValueError("only binary logistic models can be exported")
+    return LogisticScorer(coef[0], model.intercept_, features)
@@ -0,0 +1,104 @@
+# MLB Betting Model v3.1 — Streaming Synthetic Games
+# ------------------------------------------------------
+# Load tests need 10M+ simulated games, far more than fit in one
+# DataFrame. `iter_games` streams them as chunk-sized DataFrames with
+# the same columns and dtypes as `demo.simulate_games`. At most one chunk
+# (plus the last BLOCK of draws, carried over to the next chunk) is held
+# at a time, so memory depends on chunk size, not on n_games.
+#
+# Seeding is per fixed block of BLOCK games: block b draws from
+# SeedSequence(seed, spawn_key=(b,)). The stream is therefore identical
+# for any chunk size, and any slice of it can be regenerated on its own
+# (`start=`), e.g. by a worker that owns games 4M–5M.
+#
+# Games are laid out 15 a day over 162-day seasons, so `date` stays
+# realistic at any scale; `month` is the month of that date.
+# ------------------------------------------------------
+
+import numpy as np
+import pandas as pd
+
+from .odds import american_to_prob, prob_to_american
+from .schema import apply_schema, games_schema
+
+BLOCK = 1 << 16
+GAMES_PER_DAY = 15
+SEASON_GAMES = GAMES_PER_DAY * 162
+OPENING_DAY = np.datetime64("2024-03-28")
+MONEYLINES = np.array([-120, -130, -110, 100, 110])
+
+
+def game_dates(game_id):
+    """Date of each game: 15 a day from opening day, 162-day seasons a year apart."""
+    game_id = np.asarray(game_id)
+    season, slot = np.divmod(game_id, SEASON_GAMES)
+    years = (OPENING_DAY.astype("datetime64[Y]") + season).astype("datetime64[D]")
+    return years + (OPENING_DAY - OPENING_DAY.astype("datetime64[Y]")) + slot // GAMES_PER_DAY
+
+
+def game_months(game_id):
+    """Calendar month (1–12) of each game's `game_dates` date."""
+    return game_dates(game_id).astype("datetime64[M]").astype(np.int64) % 12 + 1
+
+
+def finish_games(df, dtype=np.float64):
+    """Add the market's home side, then cast to `games_schema(dtype)`."""
+    # Home side of the same market, quoted with a ~4.5% overround
+    away_implied = american_to_prob(df["away_moneyline"].to_numpy())
+    df["home_moneyline"] = np.round(prob_to_american(1.045 - away_implied)).astype(int)
+
+    # compact ints (int16 odds, int8 outcome / month, int32 ids) always;
+    # float32 mode also narrows every stat, while the random draws
+    # themselves stay identical across precisions. The delta features are
+    # not stored: design.DesignMatrix computes them from these columns.
+    return apply_schema(df, games_schema(dtype))
+
+
+def _block(seed, b):
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(b,)))
+    n = BLOCK
+    return {
+        "away_sp_xfip": rng.normal(3.8, 0.4, n),
+        "home_sp_xfip": rng.normal(3.9, 0.4, n),
+        "away_sp_kbb": rng.normal(18, 2.5, n),
+        "home_sp_kbb": rng.normal(17, 2.5, n),
+        "away_wrc_plus_vs_hand": rng.normal(108, 10, n),
+        "home_wrc_plus_vs_hand": rng.normal(104, 10, n),
+        "park_factor": rng.normal(100, 3, n),
+        "away_moneyline": MONEYLINES[rng.integers(0, len(MONEYLINES), n)],
+        "actual_outcome": (rng.random(n) > 0.47).astype(int),
+    }
+
+
+def iter_games(n_games, chunk_size=1_000_000, seed=42, start=0, dtype=np.float64):
+    """
+    Yield games start … start + n_games − 1 as DataFrames of ≤ chunk_size rows.
+
+    Columns and dtypes match `simulate_games`; values are reproducible
+    for a given seed whatever the chunk size.
+    """
+    stop = start + n_games
+    # the last block drawn is kept for the next chunk, so chunks smaller
+    # than BLOCK draw each block once rather than once per chunk
+    kept, kept_block = None, None
+    for lo in range(start, stop, chunk_size):
+        hi = min(lo + chunk_size, stop)
+        pieces = []
+        for b in range(lo // BLOCK, (hi - 1) // BLOCK + 1):
+            if b != kept:
+                kept, kept_block = b, _block(seed, b)
+            base = b * BLOCK
+            pieces.append({name: values[max(lo, base) - base:min(hi, base + BLOCK) - base]
+                           for name, values in kept_block.items()})
+        columns = {name: pieces[0][name] if len(pieces) == 1 else np.concatenate([pc[name] for pc in pieces])
+                   for name in pieces[0]}
+
+        game_id = np.arange(lo, hi)
+        df = pd.DataFrame({name: columns[name] for name in (
+            "away_sp_xfip", "home_sp_xfip", "away_sp_kbb", "home_sp_kbb",
+            "away_wrc_plus_vs_hand", "home_wrc_plus_vs_hand", "park_factor", "away_moneyline",
+            "actual_outcome")})
+        df["game_id"] = game_id
+        df["date"] = game_dates(game_id)
+        df["month"] = game_months(game_id)
+        yield finish_games(df, dtype)
@@ -0,0 +1,119 @@
+# MLB Betting Model v3.1 — Streaming Odds Tick Store
+# ------------------------------------------------------
+# In-memory line-movement store for a continuous odds feed.
+#
+# Every (game, book, market) gets one fixed-size ring buffer. All buffers
+# live in a single pair of preallocated NumPy arrays:
+#   • times   (slots, capacity)            tick timestamps
+#   • prices  (slots, capacity, n_sides)   American odds per side
+# so an append is one dict lookup plus an indexed write (O(1)), and the
+# latest price is read straight from the head position (O(1)). Older
+# ticks are overwritten once a buffer is full.
+#
+# `p_market` turns the latest quotes for a slate into de-vigged market
+# probabilities, ready for the blending step.
+# ------------------------------------------------------
+
+from collections import namedtuple
+
+import numpy as np
+
+from .devig import devig
+from .odds import american_to_prob
+
+Tick = namedtuple("Tick", ["ts", "game_id", "book", "market", "prices"])
+
+
+class TickStore:
+    def __init__(self, capacity=256, n_sides=2, initial_slots=64):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.n_sides = n_sides
+        self._slots = {}
+        self._times = np.full((initial_slots, capacity), np.nan)
+        self._prices = np.full((initial_slots, capacity, n_sides), np.nan)
+        self._head = np.zeros(initial_slots, dtype=np.int64)
+        self._count = np.zeros(initial_slots, dtype=np.int64)
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __contains__(self, key):
+        return key in self._slots
+
+    def keys(self):
+        return self._slots.keys()
+
+    # -------------------------------------------------
+    # Slot management
+    # -------------------------------------------------
+
+    def _grow(self):
+        # double the slot arrays; amortised O(1) per new key
+        n = self._times.shape[0]
+        self._times = np.concatenate([self._times, np.full_like(self._times, np.nan)])
+        self._prices = np.concatenate([self._prices, np.full_like(self._prices, np.nan)])
+        self._head = np.concatenate([self._head, np.zeros(n, dtype=np.int64)])
+        self._count = np.concatenate([self._count, np.zeros(n, dtype=np.int64)])
+
+    def _slot(self, key):
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = len(self._slots)
+            if slot == self._times.shape[0]:
+                self._grow()
+            self._slots[key] = slot
+        return slot
+
+    # -------------------------------------------------
+    # Writes
+    # -------------------------------------------------
+
+    def append(self, game_id, book, market, prices, ts):
+        """Record one quote (one American price per side) at time `ts`."""
+        slot = self._slot((game_id, book, market))
+        pos = self._head[slot]
+        self._times[slot, pos] = ts
+        self._prices[slot, pos] = prices
+        self._head[slot] = (pos + 1) % self.capacity
+        if self._count[slot] < self.capacity:
+            self._count[slot] += 1
+
+    def append_tick(self, tick):
+        self.append(tick.game_id, tick.book, tick.market, tick.prices, tick.ts)
+
+    # -------------------------------------------------
+    # Reads
+    # -------------------------------------------------
+
+    def latest(self, game_id, book, market):
+        """(ts, prices) of the most recent quote, or None if never quoted."""
+        slot = self._slots.get((game_id, book, market))
+        if slot is None:
+            return None
+        pos = (self._head[slot] - 1) % self.capacity
+        return float(self._times[slot, pos]), self._prices[slot, pos].copy()
+
+    def history(self, game_id, book, market):
+        """(times, prices) of the buffered quotes in chronological order."""
+        slot = self._slots.get((game_id, book, market))
+        if slot is None:
+            return np.empty(0), np.empty((0, self.n_sides))
+        count = self._count[slot]
+        order = (self._head[slot] - count + np.arange(count)) % self.capacity
+        return self._times[slot, order], self._prices[slot, order]
+
+    def latest_prices(self, keys):
+        """(len(keys), n_sides) latest prices for many keys; NaN where unquoted."""
+        slots = np.fromiter((self._slots.get(k, -1) for k in keys), dtype=np.int64, count=len(keys))
+        known = slots >= 0
+        result = np.full((len(keys), self.n_sides), np.nan)
+        pos = (self._head[slots[known]] - 1) % self.capacity
+        result[known] = self._prices[slots[known], pos]
+        return result
+
+    def p_market(self, game_ids, book, market="moneyline", method="multiplicative", side=0):
+        """De-vigged market probability of `side` for each game, from the latest quotes."""
+        prices = self.latest_prices([(g, book, market) for g in game_ids])
+        return devig(american_to_prob(prices), method=method)[:, side]
@@ -11,6 +11,10 @@
 # It’s structured to show how each version improves accuracy
 # — from uncalibrated v1 → blended v3.
 #
+# The model code lives in the `mlb_betting` package (demo: mlb_betting/demo.py);
+# this script is kept as the original entry point. Equivalent to:
+#   python -m mlb_betting demo
+#
 # ⚠️ DISCLAIMER:
 # ------------------------------------------------------
 # This code is intended strictly for educational and research purposes.
@@ -22,127 +26,7 @@
 # be used for actual betting or financial decision-making.
 # ------------------------------------------------------
 
-import numpy as np
-import pandas as pd
-from sklearn.linear_model import LogisticRegression
-from sklearn.isotonic import IsotonicRegression
-from sklearn.metrics import brier_score_loss, log_loss, accuracy_score
-from sklearn.model_selection import train_test_split
-
-# =====================================================
-# 1. Simulated Historical Data
-# =====================================================
-
-np.random.seed(42)
-n_games = 250
-
-df = pd.DataFrame({
-    "away_sp_xfip": np.random.normal(3.8, 0.4, n_games),
-    "home_sp_xfip": np.random.normal(3.9, 0.4, n_games),
-    "away_sp_kbb": np.random.normal(18, 2.5, n_games),
-    "home_sp_kbb": np.random.normal(17, 2.5, n_games),
-    "away_wrc_plus_vs_hand": np.random.normal(108, 10, n_games),
-    "home_wrc_plus_vs_hand": np.random.normal(104, 10, n_games),
-    "park_factor": np.random.normal(100, 3, n_games),
-    "away_moneyline": np.random.choice([-120, -130, -110, 100, 110], n_games)
-})
-
-df["actual_outcome"] = (np.random.rand(n_games) > 0.47).astype(int)
-
-df["delta_xfip"] = df["away_sp_xfip"] - df["home_sp_xfip"]
-df["delta_kbb"] = df["away_sp_kbb"] - df["home_sp_kbb"]
-df["delta_wrc"] = df["away_wrc_plus_vs_hand"] - df["home_wrc_plus_vs_hand"]
-df["delta_park"] = df["park_factor"] - 100
-
-features = ["delta_xfip", "delta_kbb", "delta_wrc", "delta_park"]
-X = df[features]
-y = df["actual_outcome"]
-
-# =====================================================
-# 2. Base Logistic Model (v1)
-# =====================================================
-
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.25, random_state=42)
-base_model = LogisticRegression()
-base_model.fit(X_train, y_train)
-df["p_base"] = base_model.predict_proba(X)[:, 1]
-
-brier_v1 = brier_score_loss(y, df["p_base"])
-logloss_v1 = log_loss(y, df["p_base"])
-acc_v1 = accuracy_score(y, (df["p_base"] > 0.5).astype(int))
-
-print("\n=== Base Model (v1) Performance ===")
-print(f"Brier Score: {brier_v1:.3f} | Log Loss: {logloss_v1:.3f} | Accuracy: {acc_v1:.3f}")
-
-# =====================================================
-# 3. Calibration Step (v2 - Platt Scaling / Isotonic)
-# =====================================================
-
-calibrator = IsotonicRegression(out_of_bounds='clip')
-df["p_calibrated"] = calibrator.fit_transform(df["p_base"], y)
-
-brier_v2 = brier_score_loss(y, df["p_calibrated"])
-logloss_v2 = log_loss(y, df["p_calibrated"])
-acc_v2 = accuracy_score(y, (df["p_calibrated"] > 0.5).astype(int))
-
-print("\n=== Calibrated Model (v2) Performance ===")
-print(f"Brier Score: {brier_v2:.3f} | Log Loss: {logloss_v2:.3f} | Accuracy: {acc_v2:.3f}")
-
-# =====================================================
-# 4. Market Blending (v3)
-# =====================================================
-
-def american_to_prob(odds):
-    return 100 / (odds + 100) if odds > 0 else (-odds) / ((-odds) + 100)
-
-alpha = 0.7
-df["p_market"] = df["away_moneyline"].apply(american_to_prob)
-df["p_blended"] = alpha * df["p_calibrated"] + (1 - alpha) * df["p_market"]
-
-brier_v3 = brier_score_loss(y, df["p_blended"])
-logloss_v3 = log_loss(y, df["p_blended"])
-acc_v3 = accuracy_score(y, (df["p_blended"] > 0.5).astype(int))
-
-print("\n=== Market-Blended Model (v3.1) Performance ===")
-print(f"Brier Score: {brier_v3:.3f} | Log Loss: {logloss_v3:.3f} | Accuracy: {acc_v3:.3f}")
-
-# =====================================================
-# 5. EV and Kelly Evaluation Example
-# =====================================================
-
-def kelly_fraction(p, odds):
-    b = (-odds / 100) if odds < 0 else (odds / 100)
-    q = 1 - p
-    edge = b * p - q
-    f_star = max(0.0, edge / b) if b > 0 else 0.0
-    return f_star, edge
-
-sample = df.sample(1, random_state=2).iloc[0]
-kelly, edge = kelly_fraction(sample.p_blended, sample.away_moneyline)
-ev = (sample.p_blended * ((-sample.away_moneyline / 100) if sample.away_moneyline < 0 else (sample.away_moneyline / 100))) - (1 - sample.p_blended)
-
-print("\n=== EV / Kelly Example ===")
-print(f"Game Example Odds: {sample.away_moneyline}")
-print(f"Blended Probability: {sample.p_blended:.3f}")
-print(f"Expected Value per $: {ev:.3f}")
-print(f"Kelly Fraction: {kelly:.3f}")
-
-# =====================================================
-# 6. Comparison Summary
-# =====================================================
-
-summary = pd.DataFrame({
-    "Model": ["Base v1", "Calibrated v2", "Blended v3"],
-    "Brier Score ↓": [brier_v1, brier_v2, brier_v3],
-    "Log Loss ↓": [logloss_v1, logloss_v2, logloss_v3],
-    "Accuracy ↑": [acc_v1, acc_v2, acc_v3]
-})
-
-print("\n=== Model Evolution Summary ===")
-print(summary.to_string(index=False))
+from mlb_betting.demo import main
 
-print("\n✅ Accuracy improved step-by-step:")
-print("• v1 → v2: Calibration reduced overconfidence.")
-print("• v2 → v3: Market blending improved realism and EV stability.")
-print("• Kelly & EV provide risk-aware decision metrics.")
-print("\nEnd of script — MLB Betting Model v3.1 (Accuracy Enhanced Demo)")
+if __name__ == "__main__":
+    main()
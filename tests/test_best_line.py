@@ -0,0 +1,22 @@
+from mlb_betting import best_line
+from mlb_betting.best_line import BestLineIndex
+
+
+def test_heap_stays_bounded_without_expire():
+    lines = BestLineIndex()
+    for t in range(50_000):
+        lines.update(t % 15, "moneyline", "away", f"book_{t % 3}", -110 - t % 20, float(t))
+    live = 15 * 3
+    assert len(lines._expiry) <= max(best_line.COMPACT_RATIO * live, best_line.COMPACT_MIN) + 1
+
+
+def test_expire_after_compaction():
+    lines = BestLineIndex()
+    for t in range(5_000):
+        lines.update(1, "moneyline", "away", "a", -120 if t % 2 else -115, float(t))
+    lines.update(1, "moneyline", "away", "b", 105, 10_000.0)
+    lines.remove(1, "moneyline", "away", "b")
+    lines.update(2, "moneyline", "away", "b", 110, 10_000.0)
+    assert lines.expire(now=10_001.0, max_age=10.0) == 1
+    assert lines.best(1, "moneyline", "away") is None
+    assert lines.best(2, "moneyline", "away").american == 110
@@ -0,0 +1,22 @@
+import numpy as np
+
+from mlb_betting import cache
+
+
+def test_source_hash_changes_with_training_code(tmp_path):
+    modules = ("oof", "online")
+    for name in modules:
+        (tmp_path / f"{name}.py").write_text(f"# {name}\n")
+    before = cache.source_hash(modules, str(tmp_path))
+    (tmp_path / "oof.py").write_text("# oof, edited\n")
+    assert cache.source_hash(modules, str(tmp_path)) != before
+
+
+def test_code_version_includes_training_source():
+    assert cache.source_hash() in cache.code_version()
+    assert set(cache.TRAINING_MODULES) >= {"demo", "oof", "online", "calibration"}
+
+
+def test_key_stable_for_same_inputs():
+    X = np.arange(6.0).reshape(3, 2)
+    assert cache.artifact_key(X, params={"C": 1.0}) == cache.artifact_key(X.copy(), params={"C": 1.0})
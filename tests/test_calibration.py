@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from sklearn.isotonic import IsotonicRegression
+
+from mlb_betting.calibration import IsotonicTable, export_isotonic
+
+KNOTS = [0.12697867137638705, 0.5, 0.9]
+VALUES = [0.1, 0.5, 0.8]
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_clips_to_end_knots(dtype):
+    table = IsotonicTable(KNOTS, VALUES)
+    out = np.empty(4, dtype=dtype)
+    table.transform([0.0, 0.05, 0.95, 1.0], out=out)
+    np.testing.assert_allclose(out, [0.1, 0.1, 0.8, 0.8], rtol=1e-6)
+
+
+def test_float32_edge_knot_rounding_below_first_threshold():
+    # float32(KNOTS[0]) < KNOTS[0]: the clipped value sorts before the first knot
+    assert float(np.float32(KNOTS[0])) < KNOTS[0]
+    table = IsotonicTable(KNOTS, VALUES)
+    out = table.transform(np.array([0.05], dtype=np.float32), out=np.empty(1, dtype=np.float32))
+    assert out[0] == pytest.approx(0.1, abs=1e-6)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_dtype_without_out(dtype):
+    table = IsotonicTable(KNOTS, VALUES)
+    assert table.transform([0.3, 0.7], dtype=dtype).dtype == dtype
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_matches_sklearn(dtype):
+    rng = np.random.default_rng(0)
+    p = rng.random(5000)
+    y = (rng.random(5000) < p).astype(int)
+    model = IsotonicRegression(out_of_bounds="clip").fit(p, y)
+    table = export_isotonic(model)
+    grid = np.linspace(-0.1, 1.1, 2001)
+    expected = model.predict(grid)
+    got = table.transform(grid, dtype=dtype)
+    assert got.dtype == dtype
+    # float32 inputs can land on the neighbouring side of a steep step
+    share = np.mean(np.abs(got - expected) > (1e-12 if dtype == np.float64 else 1e-5))
+    assert share <= (0 if dtype == np.float64 else 1e-2)
+    assert np.all((got >= model.y_thresholds_.min() - 1e-6) & (got <= model.y_thresholds_.max() + 1e-6))
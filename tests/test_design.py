@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from mlb_betting.design import ENGINEERED, DesignMatrix, design_matrix
+from mlb_betting.synthetic import iter_games
+
+FEATURES = ["delta_xfip", "delta_kbb", "delta_wrc", "delta_park"]
+
+
+def test_games_carry_raw_columns_only():
+    games = next(iter_games(100))
+    assert not set(FEATURES) & set(games.columns)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_deltas_computed_from_raw_columns(dtype):
+    games = next(iter_games(20_000, dtype=dtype))
+    X = DesignMatrix(FEATURES, dtype).build(games)
+    assert X.dtype == dtype and X.flags.c_contiguous
+    for j, name in enumerate(FEATURES):
+        a, b = ENGINEERED[name]
+        expected = games[a].to_numpy() - (games[b].to_numpy() if isinstance(b, str) else b)
+        np.testing.assert_array_equal(X[:, j], expected.astype(dtype))
+
+
+def test_stored_columns_are_copied_and_buffer_reused():
+    design = DesignMatrix(["delta_park", "x"])
+    first = design.build({"park_factor": np.array([101.0, 98.0]), "x": np.array([1, 2])})
+    np.testing.assert_array_equal(first, [[1.0, 1.0], [-2.0, 2.0]])
+    again = design.build({"delta_park": np.array([5.0]), "x": np.array([3.0])})
+    assert np.shares_memory(first, again)
+    np.testing.assert_array_equal(again, [[5.0, 3.0]])
+
+
+def test_unknown_feature():
+    with pytest.raises(KeyError):
+        design_matrix({"a": np.zeros(3)}, ["b"])
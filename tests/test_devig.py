@@ -0,0 +1,45 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from mlb_betting.devig import METHODS, devig
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_unquoted_rows_are_nan_without_warnings(method):
+    q = np.array([[0.55, 0.50], [np.nan, np.nan], [0.60, 0.45]])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        p = devig(q, method=method)
+    assert np.isnan(p[1]).all()
+    np.testing.assert_allclose(p[[0, 2]].sum(axis=1), 1.0, atol=1e-9)
+    np.testing.assert_allclose(p[[0, 2]], devig(q[[0, 2]], method=method))
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_padded_multiway_rows_still_solved(method):
+    q = np.array([[0.40, 0.35, 0.30], [0.55, 0.50, np.nan]])
+    p = devig(q, method=method, padded=True)
+    assert np.isnan(p[1, 2])
+    np.testing.assert_allclose(np.nansum(p, axis=1), 1.0, atol=1e-9)
+
+
+@pytest.mark.parametrize("method", METHODS)
+@pytest.mark.parametrize("padded", [False, True])
+def test_one_sided_two_way_row_is_unquoted(method, padded):
+    q = np.array([[0.55, np.nan], [np.nan, 0.48], [0.55, 0.50]])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        p = devig(q, method=method, padded=padded)
+    assert np.isnan(p[:2]).all()
+    assert p[2].sum() == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_missing_price_unquotes_multiway_row_unless_padded(method):
+    q = np.array([[0.40, 0.35, 0.30], [0.55, 0.50, np.nan], [0.90, np.nan, np.nan]])
+    strict = devig(q, method=method)
+    assert np.isfinite(strict[0]).all() and np.isnan(strict[1:]).all()
+    padded = devig(q, method=method, padded=True)
+    assert np.isfinite(padded[1, :2]).all() and np.isnan(padded[2]).all()
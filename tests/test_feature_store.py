@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from mlb_betting.feature_store import FeatureStore
+
+
+def _batch(game_ids, value, date="2024-04-01"):
+    n = len(game_ids)
+    return {"game_id": np.asarray(game_ids), "date": np.full(n, np.datetime64(date)),
+            "delta_xfip": np.full(n, value)}
+
+
+def test_second_batch_for_a_day_is_merged(tmp_path):
+    store = FeatureStore(str(tmp_path / "features"))
+    store.append(_batch([1, 2, 3], 0.5), ["delta_xfip"])
+    store.append(_batch([3, 4], 1.5), ["delta_xfip"])
+    stored = store.read(["delta_xfip"])
+    order = np.argsort(stored["game_id"])
+    np.testing.assert_array_equal(stored["game_id"][order], [1, 2, 3, 4])
+    # game 3 was re-sent: the later batch wins
+    np.testing.assert_array_equal(stored["delta_xfip"][order], [0.5, 0.5, 1.5, 1.5])
+    assert store.partitions() == ["2024-04-01"]
+
+
+def test_merge_leaves_other_days_alone(tmp_path):
+    store = FeatureStore(str(tmp_path / "features"))
+    store.append(_batch([1, 2], 0.5, "2024-04-01"), ["delta_xfip"])
+    store.append(_batch([3], 1.5, "2024-04-02"), ["delta_xfip"])
+    np.testing.assert_array_equal(store.read(["delta_xfip"], end="2024-04-01")["game_id"], [1, 2])
+
+
+def test_merge_rejects_different_columns(tmp_path):
+    store = FeatureStore(str(tmp_path / "features"))
+    store.append(_batch([1, 2], 0.5), ["delta_xfip"])
+    batch = dict(_batch([3], 1.5), delta_kbb=np.array([0.1]))
+    with pytest.raises(ValueError):
+        store.append(batch, ["delta_xfip", "delta_kbb"])
+    np.testing.assert_array_equal(store.read(["delta_xfip"])["game_id"], [1, 2])
@@ -0,0 +1,56 @@
+import math
+
+import pytest
+
+from mlb_betting.best_line import BestLineIndex
+from mlb_betting.blending import LogitBlend
+from mlb_betting.devig import METHODS, devig_american
+from mlb_betting.incremental import IncrementalBlender, _fair_away
+from mlb_betting.tick_store import Tick
+
+
+class _PulledLines(BestLineIndex):
+    # the ticking book's line is pulled as soon as it is recorded
+    def update_tick(self, tick, sides=("away", "home")):
+        super().update_tick(tick, sides)
+        for side in sides:
+            self.remove(tick.game_id, tick.market, side, tick.book)
+
+
+def test_no_best_line_means_no_bet():
+    blender = IncrementalBlender([7], [0.55], 0.7, _PulledLines())
+    delta = blender.on_tick(Tick(0.0, 7, "book", "moneyline", (-110, -110)))
+    assert delta.odds is None
+    assert math.isnan(delta.ev) and delta.kelly == 0.0
+    assert blender.kelly[0] == 0.0 and math.isnan(blender.ev[0])
+    assert delta.p_market == 0.5
+
+
+def test_ev_priced_at_best_line_across_books():
+    lines = BestLineIndex()
+    blender = IncrementalBlender([7], [0.55], 0.7, lines)
+    blender.on_tick(Tick(0.0, 7, "a", "moneyline", (110, -130)))
+    delta = blender.on_tick(Tick(1.0, 7, "b", "moneyline", (-120, 100)))
+    # p_market from book b, price from book a's better +110
+    assert delta.odds == 110
+    assert math.isclose(delta.ev, delta.p_blended * 2.1 - 1.0)
+
+
+@pytest.mark.parametrize("method", METHODS)
+@pytest.mark.parametrize("prices", [(-110, -110), (-150, 130), (-300, 250), (120, -140), (110, -100)])
+def test_scalar_devig_matches_array_engine(method, prices):
+    expected = devig_american(list(prices), method=method)[0]
+    assert _fair_away(*prices, method) == pytest.approx(expected, abs=1e-10)
+
+
+@pytest.mark.parametrize("logit_blend", [None, LogitBlend(0.6, 0.5, 0.08)])
+def test_home_side_is_complement_of_away(logit_blend):
+    deltas = {}
+    for side in ("away", "home"):
+        blender = IncrementalBlender([7], [0.58], 0.7, BestLineIndex(), "shin", side=side,
+                                     logit_blend=logit_blend)
+        deltas[side] = blender.on_tick(Tick(0.0, 7, "book", "moneyline", (-140, 120)))
+    away, home = deltas["away"], deltas["home"]
+    assert home.p_market == pytest.approx(1.0 - away.p_market, abs=1e-12)
+    assert home.p_blended == pytest.approx(1.0 - away.p_blended, abs=1e-12)
+    assert home.odds == 120 and home.ev == pytest.approx(home.p_blended * 2.2 - 1.0)
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from mlb_betting.portfolio import SimultaneousKelly
+
+
+@pytest.mark.parametrize("max_exact_scenarios", [1 << 16, 1])
+def test_symmetric_independent_bets_get_equal_stakes(max_exact_scenarios):
+    p = np.array([0.55, 0.55, 0.55, 0.55, 0.60])
+    odds = np.array([2.0, 2.0, 2.0, 2.0, 1.9])
+    stakes = SimultaneousKelly(max_exact_scenarios=max_exact_scenarios).solve(p, odds).stakes
+    np.testing.assert_allclose(stakes[:4], stakes[0], rtol=0, atol=1e-12)
+    assert stakes[0] > 0.0
+
+
+@pytest.mark.parametrize("max_exact_scenarios", [1 << 16, 1])
+def test_symmetric_groups_get_equal_stakes(max_exact_scenarios):
+    p = np.array([0.55, 0.52, 0.55, 0.52])
+    odds = np.array([2.0, 2.1, 2.0, 2.1])
+    groups = np.array([0, 0, 1, 1])
+    stakes = SimultaneousKelly(max_exact_scenarios=max_exact_scenarios).solve(p, odds, groups=groups).stakes
+    np.testing.assert_allclose(stakes[[2, 3]], stakes[[0, 1]], rtol=0, atol=1e-12)
+
+
+def test_exact_solution_ignores_seed():
+    p = np.array([0.55, 0.58, 0.52])
+    odds = np.array([2.0, 1.85, 2.05])
+    a = SimultaneousKelly(seed=1).solve(p, odds).stakes
+    b = SimultaneousKelly(seed=2).solve(p, odds).stakes
+    np.testing.assert_array_equal(a, b)
+
+
+def test_single_bet_matches_kelly():
+    p, odds = 0.55, 2.0
+    stake = SimultaneousKelly().solve([p], [odds]).stakes[0]
+    assert stake == pytest.approx((p * (odds - 1) - (1 - p)) / (odds - 1), abs=1e-8)
+
+
+@pytest.mark.parametrize("max_total, max_stake", [(0.3, 1.0), (0.2, 0.04)])
+def test_binding_bankroll_matches_reference_optimum(max_total, max_stake):
+    optimize = pytest.importorskip("scipy.optimize")
+    rng = np.random.default_rng(11)
+    p = rng.uniform(0.5, 0.7, 10)
+    odds = (1.0 + rng.uniform(0.1, 0.4, 10)) / p
+    kelly = SimultaneousKelly(max_total=max_total, max_stake=max_stake)
+    result = kelly.solve(p, odds)
+
+    R, weights, exact = kelly._scenarios(p, odds - 1.0, np.arange(10))
+    assert exact
+    reference = optimize.minimize(
+        lambda f: -(weights @ np.log(1.0 + R @ f)), np.zeros(10),
+        jac=lambda f: -(R.T @ (weights / (1.0 + R @ f))),
+        bounds=[(0.0, max_stake)] * 10, method="SLSQP", options={"ftol": 1e-15, "maxiter": 1000},
+        constraints=[{"type": "ineq", "fun": lambda f: max_total - f.sum(), "jac": lambda f: -np.ones(10)}])
+    assert result.converged
+    assert result.stakes.sum() == pytest.approx(max_total, abs=1e-6)
+    assert result.growth >= -reference.fun - 1e-9
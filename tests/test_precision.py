@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from sklearn.isotonic import IsotonicRegression
+from sklearn.linear_model import LogisticRegression
+
+from mlb_betting.calibration import export_isotonic
+from mlb_betting.scorer import export_logistic
+from mlb_betting.slate import SlateScorer
+
+# small-n version of benchmarks/bench_precision.py, same tolerances
+FEATURES = ["delta_xfip", "delta_kbb", "delta_wrc", "delta_park"]
+SCALE = [0.57, 3.5, 14.0, 3.0]
+TOL_METRIC = 1e-6
+TOL_FLIPS = 1e-4
+N_GAMES = 20_000
+
+
+def _metrics(p, y, ev):
+    p = p.astype(np.float64)
+    q = np.clip(p, 1e-15, 1 - 1e-15)
+    return {
+        "Brier score": np.mean((p - y) ** 2),
+        "log loss": -np.mean(y * np.log(q) + (1 - y) * np.log1p(-q)),
+        "mean EV": np.mean(ev, dtype=np.float64),
+    }
+
+
+@pytest.fixture(scope="module")
+def scored():
+    rng = np.random.default_rng(42)
+    X = rng.normal(0.0, SCALE, (N_GAMES, 4))
+    y = (rng.random(N_GAMES) < 1.0 / (1.0 + np.exp(-X @ [-0.4, 0.05, 0.02, 0.01]))).astype(np.int8)
+    away = rng.choice([-150, -130, -120, -110, 100, 110, 125, 140], N_GAMES)
+    odds = np.column_stack([away, np.where(away > 0, -away - 20, 100)]).astype(np.int16)
+
+    train = slice(0, 5_000)
+    model = LogisticRegression().fit(X[train], y[train])
+    isotonic = IsotonicRegression(out_of_bounds="clip").fit(model.predict_proba(X[train])[:, 1], y[train])
+    scorer, calibration = export_logistic(model, FEATURES), export_isotonic(isotonic)
+    records = {dtype: SlateScorer(scorer, calibration, alpha=0.6, dtype=dtype).score_slate(X.astype(dtype), odds)
+               for dtype in (np.float64, np.float32)}
+    return records[np.float64], records[np.float32], y
+
+
+@pytest.mark.parametrize("metric", ["Brier score", "log loss", "mean EV"])
+def test_float32_metrics_match_float64(scored, metric):
+    r64, r32, y = scored
+    m64, m32 = _metrics(r64["p_blended"], y, r64["ev"]), _metrics(r32["p_blended"], y, r32["ev"])
+    assert abs(m64[metric] - m32[metric]) <= TOL_METRIC
+
+
+def test_float32_bet_decisions_match_float64(scored):
+    r64, r32, _ = scored
+    assert r32.dtype["stake"] == np.float32
+    assert np.mean((r64["stake"] > 0) != (r32["stake"] > 0)) <= TOL_FLIPS
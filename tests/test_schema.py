@@ -0,0 +1,24 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mlb_betting.best_line import BestLineIndex
+from mlb_betting.schema import apply_schema, games_schema
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_unquoted_game_keeps_nan_best_odds(dtype):
+    lines = BestLineIndex()
+    lines.update(1, "moneyline", "away", "book", -120, 0.0)
+    df = pd.DataFrame({"game_id": [1, 2], "away_moneyline": [-120, 105], "home_moneyline": [100, -125]})
+    # game 2 has no quote in the index
+    df["best_odds"] = lines.best_american([(g, "moneyline", "away") for g in df["game_id"]])
+    apply_schema(df, games_schema(dtype))
+    assert df["best_odds"].dtype == dtype
+    assert df["best_odds"].iloc[0] == -120 and np.isnan(df["best_odds"].iloc[1])
+    assert df["away_moneyline"].dtype == np.int16
+
+
+def test_integer_cast_of_missing_values_is_refused():
+    with pytest.raises(ValueError):
+        apply_schema(pd.DataFrame({"away_moneyline": [-110.0, np.nan]}), games_schema())
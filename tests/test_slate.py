@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from mlb_betting.blending import LogitBlend
+from mlb_betting.calibration import IsotonicTable
+from mlb_betting.scorer import LogisticScorer
+from mlb_betting.slate import SlateScorer
+
+FEATURES = ["delta_xfip", "delta_kbb"]
+
+
+def _slate(n=50, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(0.0, 1.0, (n, len(FEATURES)))
+    odds = np.column_stack([rng.choice([-150, -120, -105, 110, 130], n),
+                            rng.choice([-140, -115, 100, 120, 145], n)])
+    return X, odds
+
+
+@pytest.mark.parametrize("logit_blend", [None, LogitBlend(0.6, 0.5, 0.08)])
+@pytest.mark.parametrize("devig_method", ["multiplicative", "shin"])
+def test_home_side_is_complement_of_away(logit_blend, devig_method):
+    X, odds = _slate()
+    scorer = SlateScorer(LogisticScorer([-0.4, 0.3], 0.05, FEATURES), IsotonicTable([0.2, 0.8], [0.25, 0.75]),
+                         alpha=0.7, logit_blend=logit_blend, devig_method=devig_method)
+    away = scorer.score_slate(X, odds, side=0)
+    home = scorer.score_slate(X, odds, side=1)
+    np.testing.assert_array_equal(home["p_calibrated"], away["p_calibrated"])
+    np.testing.assert_allclose(home["p_market"], 1.0 - away["p_market"], rtol=0, atol=1e-12)
+    np.testing.assert_allclose(home["p_blended"], 1.0 - away["p_blended"], rtol=0, atol=1e-12)
+    decimal = np.where(odds[:, 1] > 0, 1.0 + odds[:, 1] / 100.0, 1.0 - 100.0 / odds[:, 1])
+    np.testing.assert_allclose(home["ev"], home["p_blended"] * decimal - 1.0, rtol=0, atol=1e-12)
+
+
+def test_rejects_other_sides():
+    X, odds = _slate(5)
+    scorer = SlateScorer(LogisticScorer([-0.4, 0.3], 0.05, FEATURES), IsotonicTable([0.2, 0.8], [0.25, 0.75]))
+    with pytest.raises(ValueError):
+        scorer.score_slate(X, odds, side=2)
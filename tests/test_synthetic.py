@@ -0,0 +1,27 @@
+import pandas as pd
+import pytest
+
+from mlb_betting import synthetic
+from mlb_betting.synthetic import BLOCK, iter_games
+
+
+@pytest.mark.parametrize("chunk_size", [1000, BLOCK, 50_000, 200_000])
+def test_stream_independent_of_chunk_size(chunk_size):
+    n, start = 150_000, 30_000
+    whole = next(iter_games(n, chunk_size=n, start=start))
+    chunked = pd.concat(list(iter_games(n, chunk_size=chunk_size, start=start)), ignore_index=True)
+    pd.testing.assert_frame_equal(chunked, whole)
+
+
+def test_each_block_drawn_once(monkeypatch):
+    calls = []
+    draw = synthetic._block
+    monkeypatch.setattr(synthetic, "_block", lambda seed, b: calls.append(b) or draw(seed, b))
+    for _ in iter_games(3 * BLOCK, chunk_size=5000):
+        pass
+    assert calls == [0, 1, 2]
+
+
+def test_month_is_month_of_date():
+    games = next(iter_games(2 * synthetic.SEASON_GAMES, chunk_size=2 * synthetic.SEASON_GAMES))
+    assert (games["month"] == games["date"].dt.month).all()